@@ -40,7 +40,6 @@ from ..plugins import (
 )
 from ..transports import get_transport
 from ..utils.git import resolve_default_base, resolve_main_worktree_root
-from ..telegram import onboarding
 from ..telegram.client import TelegramClient
 from ..telegram.topics import _validate_topics_setup_for
 from .doctor import (
@@ -54,6 +53,7 @@ from .doctor import (
 from .init import (
     _default_alias_from_path,
     _ensure_projects_table,
+    _find_project_key,
     _prompt_alias,
     run_init,
 )
@@ -97,6 +97,14 @@ from .handoff import app as handoff_app
 from .reload import reload_command
 
 
+def __getattr__(name: str) -> object:
+    if name == "onboarding":
+        from ..telegram import onboarding
+
+        return onboarding
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def _load_settings_optional() -> tuple[TakopiSettings | None, Path | None]:
     try:
         loaded = load_settings_if_exists()
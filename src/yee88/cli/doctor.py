@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import os
-import sys
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 from pathlib import Path
@@ -17,6 +16,7 @@ from ..runtime_loader import resolve_plugins_allowlist
 from ..settings import TakopiSettings, TelegramTopicsSettings
 from ..telegram.client import TelegramClient
 from ..telegram.topics import _validate_topics_setup_for
+from .run import _cli_hook
 
 DoctorStatus = Literal["ok", "warning", "error"]
 
@@ -64,9 +64,9 @@ async def _doctor_telegram_checks(
     project_chat_ids: tuple[int, ...],
 ) -> list[DoctorCheck]:
     checks: list[DoctorCheck] = []
-    client_factory = _resolve_cli_attr("TelegramClient") or TelegramClient
-    validate_topics = (
-        _resolve_cli_attr("_validate_topics_setup_for") or _validate_topics_setup_for
+    client_factory = _cli_hook("TelegramClient", TelegramClient)
+    validate_topics = _cli_hook(
+        "_validate_topics_setup_for", _validate_topics_setup_for
     )
     bot = client_factory(token)
     try:
@@ -164,10 +164,3 @@ def run_doctor(
         typer.echo(check.render())
     if any(check.status == "error" for check in checks):
         raise typer.Exit(code=1)
-
-
-def _resolve_cli_attr(name: str) -> object | None:
-    cli_module = sys.modules.get("yee88.cli")
-    if cli_module is None:
-        return None
-    return getattr(cli_module, name, None)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from collections.abc import Callable
 from pathlib import Path
 
@@ -26,12 +27,9 @@ def _prompt_alias(value: str | None, *, default_alias: str | None = None) -> str
     return alias
 
 
-def _default_alias_from_path(path: Path) -> str | None:
-    name = path.name
-    if not name:
-        return None
-    name = name.removesuffix(".git")
-    return name or None
+def _default_alias_from_path(path: str | os.PathLike[str]) -> str | None:
+    name = os.path.basename(os.fspath(path).rstrip(os.sep))
+    return name.removesuffix(".git") or None
 
 
 def _ensure_projects_table(config: dict, config_path: Path) -> dict:
@@ -41,6 +39,20 @@ def _ensure_projects_table(config: dict, config_path: Path) -> dict:
     return projects
 
 
+def _find_project_key(
+    config: dict, config_path: Path, name: str
+) -> tuple[dict, str | None]:
+    projects = _ensure_projects_table(config, config_path)
+    if name in projects:
+        return projects, name
+    lowered = name.lower()
+    key = next(
+        (key for key in projects if isinstance(key, str) and key.lower() == lowered),
+        None,
+    )
+    return projects, key
+
+
 def run_init(
     *,
     alias: str | None,
@@ -53,9 +65,9 @@ def run_init(
 ) -> None:
     config, config_path = load_or_init_config_fn()
     if config_path.exists():
-        applied = migrate_config(config, config_path=config_path)
-        if applied:
-            write_config(config, config_path)
+        # Migrations only touch the in-memory table; the single write at the
+        # end persists them together with the new project entry.
+        migrate_config(config, config_path=config_path)
 
     cwd = Path.cwd()
     project_path = resolve_main_worktree_root_fn(cwd) or cwd
@@ -71,17 +83,13 @@ def run_init(
         reserved=RESERVED_CHAT_COMMANDS,
     )
 
-    alias_key = alias.lower()
-    if alias_key in {engine.lower() for engine in engine_ids}:
+    conflict = projects_cfg.alias_conflict(alias)
+    if conflict is not None:
         raise ConfigError(
-            f"Invalid project alias {alias!r}; aliases must not match engine ids."
-        )
-    if alias_key in RESERVED_CHAT_COMMANDS:
-        raise ConfigError(
-            f"Invalid project alias {alias!r}; aliases must not match reserved commands."
+            f"Invalid project alias {alias!r}; aliases must not match {conflict}."
         )
 
-    existing = projects_cfg.projects.get(alias_key)
+    existing = projects_cfg.projects.get(alias.lower())
     if existing is not None:
         overwrite = typer.confirm(
             f"project {existing.alias!r} already exists, overwrite?",
@@ -91,7 +99,7 @@ def run_init(
             raise typer.Exit(code=1)
 
     projects = _ensure_projects_table(config, config_path)
-    if existing is not None and existing.alias in projects:
+    if existing is not None:
         projects.pop(existing.alias, None)
 
     default_engine = settings.default_engine
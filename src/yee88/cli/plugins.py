@@ -1,10 +1,7 @@
 from __future__ import annotations
 
-import sys
 from collections.abc import Callable
 from importlib.metadata import EntryPoint
-from pathlib import Path
-from typing import cast
 
 import typer
 
@@ -15,7 +12,6 @@ from ..ids import RESERVED_COMMAND_IDS, RESERVED_ENGINE_IDS
 from ..plugins import (
     COMMAND_GROUP,
     ENGINE_GROUP,
-    PluginLoadError,
     TRANSPORT_GROUP,
     entrypoint_distribution_name,
     get_load_errors,
@@ -24,39 +20,46 @@ from ..plugins import (
     normalize_allowlist,
 )
 from ..runtime_loader import resolve_plugins_allowlist
-from ..settings import TakopiSettings, load_settings_if_exists
 from ..transports import get_transport
-
-
-def _load_settings_optional() -> tuple[TakopiSettings | None, Path | None]:
-    try:
-        loaded = load_settings_if_exists()
-    except ConfigError:
-        return None, None
-    if loaded is None:
-        return None, None
-    return loaded
+from .run import _cli_hook, _load_settings_optional
 
 
 def _print_entrypoints(
     label: str,
     entrypoints: list[EntryPoint],
     *,
+    lines: list[str],
     allowlist: set[str] | None,
     entrypoint_distribution_name_fn: Callable[[EntryPoint], str | None],
     is_entrypoint_allowed_fn: Callable[[EntryPoint, set[str] | None], bool],
-) -> None:
-    typer.echo(f"{label}:")
+) -> list[tuple[EntryPoint, bool]]:
+    lines.append(f"{label}:")
     if not entrypoints:
-        typer.echo("  (none)")
-        return
+        lines.append("  (none)")
+        return []
+    statuses: list[tuple[EntryPoint, bool]] = []
     for ep in entrypoints:
         dist = entrypoint_distribution_name_fn(ep) or "unknown"
         status = ""
+        allowed = True
         if allowlist is not None:
             allowed = is_entrypoint_allowed_fn(ep, allowlist)
             status = " enabled" if allowed else " disabled"
-        typer.echo(f"  {ep.name} ({dist}){status}")
+        statuses.append((ep, allowed))
+        lines.append(f"  {ep.name} ({dist}){status}")
+    return statuses
+
+
+def _load_plugin_quietly(
+    loader: Callable[..., object],
+    name: str,
+    *,
+    allowlist: list[str] | None,
+) -> None:
+    try:
+        loader(name, allowlist=allowlist)
+    except ConfigError:
+        return
 
 
 def plugins_cmd(
@@ -67,49 +70,24 @@ def plugins_cmd(
     ),
 ) -> None:
     """List discovered plugins and optionally validate them."""
-    load_settings_optional = cast(
-        Callable[[], tuple[TakopiSettings | None, Path | None]],
-        _resolve_cli_attr("_load_settings_optional") or _load_settings_optional,
-    )
-    resolve_plugins_allowlist_fn = cast(
-        Callable[[TakopiSettings | None], list[str] | None],
-        _resolve_cli_attr("resolve_plugins_allowlist") or resolve_plugins_allowlist,
-    )
-    list_entrypoints_fn = cast(
-        Callable[..., list[EntryPoint]],
-        _resolve_cli_attr("list_entrypoints") or list_entrypoints,
-    )
-    get_backend_fn = cast(
-        Callable[..., object],
-        _resolve_cli_attr("get_backend") or get_backend,
-    )
-    get_transport_fn = cast(
-        Callable[..., object],
-        _resolve_cli_attr("get_transport") or get_transport,
+    load_settings_optional_fn = _cli_hook(
+        "_load_settings_optional", _load_settings_optional
     )
-    get_command_fn = cast(
-        Callable[..., object],
-        _resolve_cli_attr("get_command") or get_command,
+    resolve_plugins_allowlist_fn = _cli_hook(
+        "resolve_plugins_allowlist", resolve_plugins_allowlist
     )
-    get_load_errors_fn = cast(
-        Callable[[], tuple[PluginLoadError, ...]],
-        _resolve_cli_attr("get_load_errors") or get_load_errors,
-    )
-    entrypoint_distribution_name_fn = cast(
-        Callable[[EntryPoint], str | None],
-        _resolve_cli_attr("entrypoint_distribution_name")
-        or entrypoint_distribution_name,
-    )
-    is_entrypoint_allowed_fn = cast(
-        Callable[[EntryPoint, set[str] | None], bool],
-        _resolve_cli_attr("is_entrypoint_allowed") or is_entrypoint_allowed,
-    )
-    normalize_allowlist_fn = cast(
-        Callable[[list[str] | None], set[str] | None],
-        _resolve_cli_attr("normalize_allowlist") or normalize_allowlist,
+    list_entrypoints_fn = _cli_hook("list_entrypoints", list_entrypoints)
+    get_backend_fn = _cli_hook("get_backend", get_backend)
+    get_transport_fn = _cli_hook("get_transport", get_transport)
+    get_command_fn = _cli_hook("get_command", get_command)
+    get_load_errors_fn = _cli_hook("get_load_errors", get_load_errors)
+    entrypoint_distribution_name_fn = _cli_hook(
+        "entrypoint_distribution_name", entrypoint_distribution_name
     )
+    is_entrypoint_allowed_fn = _cli_hook("is_entrypoint_allowed", is_entrypoint_allowed)
+    normalize_allowlist_fn = _cli_hook("normalize_allowlist", normalize_allowlist)
 
-    settings_hint, _ = load_settings_optional()
+    settings_hint, _ = load_settings_optional_fn()
     allowlist = resolve_plugins_allowlist_fn(settings_hint)
 
     allowlist_set = normalize_allowlist_fn(allowlist)
@@ -123,60 +101,45 @@ def plugins_cmd(
         reserved_ids=RESERVED_COMMAND_IDS,
     )
 
-    _print_entrypoints(
+    lines: list[str] = []
+    engine_statuses = _print_entrypoints(
         "engine backends",
         engine_eps,
+        lines=lines,
         allowlist=allowlist_set,
         entrypoint_distribution_name_fn=entrypoint_distribution_name_fn,
         is_entrypoint_allowed_fn=is_entrypoint_allowed_fn,
     )
-    _print_entrypoints(
+    transport_statuses = _print_entrypoints(
         "transport backends",
         transport_eps,
+        lines=lines,
         allowlist=allowlist_set,
         entrypoint_distribution_name_fn=entrypoint_distribution_name_fn,
         is_entrypoint_allowed_fn=is_entrypoint_allowed_fn,
     )
-    _print_entrypoints(
+    command_statuses = _print_entrypoints(
         "command backends",
         command_eps,
+        lines=lines,
         allowlist=allowlist_set,
         entrypoint_distribution_name_fn=entrypoint_distribution_name_fn,
         is_entrypoint_allowed_fn=is_entrypoint_allowed_fn,
     )
 
     if load:
-        for ep in engine_eps:
-            if allowlist_set is not None and not is_entrypoint_allowed_fn(
-                ep, allowlist_set
-            ):
-                continue
-            try:
-                get_backend_fn(ep.name, allowlist=allowlist)
-            except ConfigError:
-                continue
-        for ep in transport_eps:
-            if allowlist_set is not None and not is_entrypoint_allowed_fn(
-                ep, allowlist_set
-            ):
-                continue
-            try:
-                get_transport_fn(ep.name, allowlist=allowlist)
-            except ConfigError:
-                continue
-        for ep in command_eps:
-            if allowlist_set is not None and not is_entrypoint_allowed_fn(
-                ep, allowlist_set
-            ):
-                continue
-            try:
-                get_command_fn(ep.name, allowlist=allowlist)
-            except ConfigError:
-                continue
+        for loader, statuses in (
+            (get_backend_fn, engine_statuses),
+            (get_transport_fn, transport_statuses),
+            (get_command_fn, command_statuses),
+        ):
+            for ep, allowed in statuses:
+                if allowed:
+                    _load_plugin_quietly(loader, ep.name, allowlist=allowlist)
 
     errors = get_load_errors_fn()
     if errors:
-        typer.echo("errors:")
+        lines.append("errors:")
         for err in errors:
             group = err.group
             if group == ENGINE_GROUP:
@@ -186,11 +149,5 @@ def plugins_cmd(
             elif group == COMMAND_GROUP:
                 group = "command"
             dist = err.distribution or "unknown"
-            typer.echo(f"  {group} {err.name} ({dist}): {err.error}")
-
-
-def _resolve_cli_attr(name: str) -> object | None:
-    cli_module = sys.modules.get("yee88.cli")
-    if cli_module is None:
-        return None
-    return getattr(cli_module, name, None)
+            lines.append(f"  {group} {err.name} ({dist}): {err.error}")
+    typer.echo("\n".join(lines))
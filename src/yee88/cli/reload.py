@@ -3,13 +3,13 @@ from __future__ import annotations
 import os
 import signal
 import sys
-import time
+from functools import cache
 from pathlib import Path
 
 import typer
 
-from ..config import HOME_CONFIG_PATH, load_or_init_config
-from ..lockfile import _pid_running, _read_lock_info, lock_path_for_config
+from ..config import HOME_CONFIG_PATH
+from ..lockfile import _read_lock_info, lock_path_for_config
 from ..logging import get_logger
 
 logger = get_logger(__name__)
@@ -17,13 +17,15 @@ logger = get_logger(__name__)
 _reload_requested = False
 
 
-def _get_exec_args() -> tuple[str, list[str]]:
+@cache
+def _get_exec_args() -> tuple[str, tuple[str, ...]]:
     import shutil
+
     yee88_path = shutil.which("yee88")
     if yee88_path:
-        return yee88_path, ["yee88"]
+        return yee88_path, ("yee88",)
     executable = sys.executable
-    args = [executable, "-m", "yee88"]
+    args = (executable, "-m", "yee88")
     return executable, args
 
 
@@ -52,27 +54,27 @@ def _handle_sighup(signum: int, frame: object) -> None:
 
 def install_reload_handler() -> None:
     if hasattr(signal, "SIGHUP"):
+        # Resolve the restart command now so the reload path skips the PATH walk.
+        _get_exec_args()
         signal.signal(signal.SIGHUP, _handle_sighup)
         logger.debug("reload.handler_installed", signal="SIGHUP")
 
 
 def _find_running_instance(config_path: Path | None = None) -> tuple[int, Path] | None:
     if config_path is None:
-        try:
-            _, config_path = load_or_init_config()
-        except Exception:
-            config_path = HOME_CONFIG_PATH
+        # load_or_init_config() always resolves to the home config when no path
+        # is given; skip parsing the file just to learn its location.
+        config_path = HOME_CONFIG_PATH
     
     lock_path = lock_path_for_config(config_path)
     lock_info = _read_lock_info(lock_path)
     
-    if lock_info is None or lock_info.pid is None:
-        return None
-    
-    if not _pid_running(lock_info.pid):
-        lock_path.unlink(missing_ok=True)
+    # pid <= 0 would signal a whole process group.
+    if lock_info is None or lock_info.pid is None or lock_info.pid <= 0:
         return None
     
+    # Liveness is not probed here: the SIGHUP itself reports a dead pid via
+    # ProcessLookupError, and callers drop the stale lock then.
     return lock_info.pid, lock_path
 
 
@@ -82,7 +84,7 @@ def send_reload_signal(config_path: Path | None = None) -> bool:
     if result is None:
         return False
     
-    pid, _ = result
+    pid, lock_path = result
     
     if pid == os.getpid():
         return False
@@ -90,7 +92,10 @@ def send_reload_signal(config_path: Path | None = None) -> bool:
     try:
         os.kill(pid, signal.SIGHUP)
         return True
-    except (ProcessLookupError, PermissionError):
+    except ProcessLookupError:
+        lock_path.unlink(missing_ok=True)
+        return False
+    except PermissionError:
         return False
 
 
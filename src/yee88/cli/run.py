@@ -3,16 +3,22 @@ from __future__ import annotations
 import os
 import sys
 from collections.abc import Callable
-from functools import partial
+from functools import cache, partial
 from pathlib import Path
-from typing import Any, cast
+from types import ModuleType
+from typing import cast
 
 import anyio
 import typer
 
 from .. import __version__
 from ..backends import EngineBackend
-from ..config import ConfigError, load_or_init_config
+from ..config import (
+    HOME_CONFIG_PATH,
+    ConfigError,
+    config_stamp,
+    load_or_init_config,
+)
 from ..engines import get_backend
 from ..ids import RESERVED_CHAT_COMMANDS
 from ..lockfile import LockError, LockHandle, acquire_lock, token_fingerprint
@@ -42,10 +48,7 @@ def _resolve_transport_id(override: str | None) -> str:
         if not value:
             raise ConfigError("Invalid `--transport`; expected a non-empty string.")
         return value
-    load_or_init_config_fn = cast(
-        Callable[[], tuple[dict, Path]],
-        _resolve_cli_attr("load_or_init_config") or load_or_init_config,
-    )
+    load_or_init_config_fn = _cli_hook("load_or_init_config", load_or_init_config)
     try:
         config, _ = load_or_init_config_fn()
     except ConfigError:
@@ -58,23 +61,14 @@ def _resolve_transport_id(override: str | None) -> str:
 
 def acquire_config_lock(config_path: Path, token: str | None) -> LockHandle:
     fingerprint = token_fingerprint(token) if token else None
-    acquire_lock_fn = cast(
-        Callable[..., LockHandle],
-        _resolve_cli_attr("acquire_lock") or acquire_lock,
-    )
+    acquire_lock_fn = _cli_hook("acquire_lock", acquire_lock)
     try:
         return acquire_lock_fn(
             config_path=config_path,
             token_fingerprint=fingerprint,
         )
     except LockError as exc:
-        lines = str(exc).splitlines()
-        if lines:
-            typer.echo(lines[0], err=True)
-            if len(lines) > 1:
-                typer.echo("\n".join(lines[1:]), err=True)
-        else:
-            typer.echo("error: unknown error", err=True)
+        typer.echo(str(exc) or "error: unknown error", err=True)
         raise typer.Exit(code=1) from exc
 
 
@@ -101,22 +95,16 @@ def _resolve_setup_engine(
     str,
     EngineBackend,
 ]:
-    load_settings_optional_fn = cast(
-        Callable[[], tuple[TakopiSettings | None, Path | None]],
-        _resolve_cli_attr("_load_settings_optional") or _load_settings_optional,
+    load_settings_optional_fn = _cli_hook(
+        "_load_settings_optional", _load_settings_optional
     )
-    resolve_plugins_allowlist_fn = cast(
-        Callable[[TakopiSettings | None], list[str] | None],
-        _resolve_cli_attr("resolve_plugins_allowlist") or resolve_plugins_allowlist,
+    resolve_plugins_allowlist_fn = _cli_hook(
+        "resolve_plugins_allowlist", resolve_plugins_allowlist
     )
-    default_engine_for_setup_fn = cast(
-        Callable[..., str],
-        _resolve_cli_attr("_default_engine_for_setup") or _default_engine_for_setup,
-    )
-    get_backend_fn = cast(
-        Callable[..., EngineBackend],
-        _resolve_cli_attr("get_backend") or get_backend,
+    default_engine_for_setup_fn = _cli_hook(
+        "_default_engine_for_setup", _default_engine_for_setup
     )
+    get_backend_fn = _cli_hook("get_backend", get_backend)
 
     settings_hint, config_hint = load_settings_optional_fn()
     allowlist = resolve_plugins_allowlist_fn(settings_hint)
@@ -148,90 +136,52 @@ def _run_auto_router(
     debug: bool,
     onboard: bool,
 ) -> None:
-    setup_logging_fn = cast(
-        Callable[..., None],
-        _resolve_cli_attr("setup_logging") or setup_logging,
-    )
-    resolve_setup_engine_fn = cast(
-        Callable[
-            [str | None],
-            tuple[
-                TakopiSettings | None,
-                Path | None,
-                list[str] | None,
-                str,
-                EngineBackend,
-            ],
-        ],
-        _resolve_cli_attr("_resolve_setup_engine") or _resolve_setup_engine,
-    )
-    resolve_transport_id_fn = cast(
-        Callable[[str | None], str],
-        _resolve_cli_attr("_resolve_transport_id") or _resolve_transport_id,
-    )
-    get_transport_fn = cast(
-        Callable[..., Any],
-        _resolve_cli_attr("get_transport") or get_transport,
-    )
-    should_run_interactive_fn = cast(
-        Callable[[], bool],
-        _resolve_cli_attr("_should_run_interactive") or _should_run_interactive,
-    )
-    setup_needs_config_fn = cast(
-        Callable[[SetupResult], bool],
-        _resolve_cli_attr("_setup_needs_config") or _setup_needs_config,
-    )
-    config_path_display_fn = cast(
-        Callable[[Path], str],
-        _resolve_cli_attr("_config_path_display") or _config_path_display,
-    )
-    fail_missing_config_fn = cast(
-        Callable[[Path], None],
-        _resolve_cli_attr("_fail_missing_config") or _fail_missing_config,
-    )
-    load_settings_fn = cast(
-        Callable[[], tuple[TakopiSettings, Path]],
-        _resolve_cli_attr("load_settings") or load_settings,
-    )
-    build_runtime_spec_fn = cast(
-        Callable[..., Any],
-        _resolve_cli_attr("build_runtime_spec") or build_runtime_spec,
-    )
-    acquire_config_lock_fn = cast(
-        Callable[[Path, str | None], LockHandle],
-        _resolve_cli_attr("acquire_config_lock") or acquire_config_lock,
+    setup_logging_fn = _cli_hook("setup_logging", setup_logging)
+    resolve_setup_engine_fn = _cli_hook("_resolve_setup_engine", _resolve_setup_engine)
+    resolve_transport_id_fn = _cli_hook("_resolve_transport_id", _resolve_transport_id)
+    get_transport_fn = _cli_hook("get_transport", get_transport)
+    should_run_interactive_fn = _cli_hook(
+        "_should_run_interactive", _should_run_interactive
     )
+    setup_needs_config_fn = _cli_hook("_setup_needs_config", _setup_needs_config)
+    config_path_display_fn = _cli_hook("_config_path_display", _config_path_display)
+    fail_missing_config_fn = _cli_hook("_fail_missing_config", _fail_missing_config)
+    load_settings_fn = _cli_hook("load_settings", load_settings)
+    build_runtime_spec_fn = _cli_hook("build_runtime_spec", build_runtime_spec)
+    acquire_config_lock_fn = _cli_hook("acquire_config_lock", acquire_config_lock)
 
     if debug:
         os.environ.setdefault("TAKOPI_LOG_FILE", "debug.log")
     setup_logging_fn(debug=debug)
     lock_handle: LockHandle | None = None
     try:
-        (
-            settings_hint,
-            config_hint,
-            allowlist,
-            default_engine,
-            engine_backend,
-        ) = resolve_setup_engine_fn(default_engine_override)
+        setup_stamp = config_stamp(HOME_CONFIG_PATH)
+        _, _, allowlist, _, engine_backend = resolve_setup_engine_fn(
+            default_engine_override
+        )
         transport_id = resolve_transport_id_fn(transport_override)
         transport_backend = get_transport_fn(transport_id, allowlist=allowlist)
     except ConfigError as exc:
         typer.echo(f"error: {exc}", err=True)
         raise typer.Exit(code=1) from exc
+
+    def refresh_engine_backend() -> EngineBackend:
+        # Interactive setup may have rewritten the config; only re-run
+        # settings load and plugin discovery when it actually changed.
+        nonlocal setup_stamp
+        stamp = config_stamp(HOME_CONFIG_PATH)
+        if stamp == setup_stamp:
+            return engine_backend
+        setup_stamp = stamp
+        return resolve_setup_engine_fn(default_engine_override)[4]
+
     if onboard:
         if not should_run_interactive_fn():
             typer.echo("error: --onboard requires a TTY", err=True)
             raise typer.Exit(code=1)
         if not anyio.run(partial(transport_backend.interactive_setup, force=True)):
             raise typer.Exit(code=1)
-        (
-            settings_hint,
-            config_hint,
-            allowlist,
-            default_engine,
-            engine_backend,
-        ) = resolve_setup_engine_fn(default_engine_override)
+        engine_backend = refresh_engine_backend()
     setup = transport_backend.check_setup(
         engine_backend,
         transport_override=transport_override,
@@ -248,25 +198,13 @@ def _run_auto_router(
                 if run_onboard and anyio.run(
                     partial(transport_backend.interactive_setup, force=True)
                 ):
-                    (
-                        settings_hint,
-                        config_hint,
-                        allowlist,
-                        default_engine,
-                        engine_backend,
-                    ) = resolve_setup_engine_fn(default_engine_override)
+                    engine_backend = refresh_engine_backend()
                     setup = transport_backend.check_setup(
                         engine_backend,
                         transport_override=transport_override,
                     )
             elif anyio.run(partial(transport_backend.interactive_setup, force=False)):
-                (
-                    settings_hint,
-                    config_hint,
-                    allowlist,
-                    default_engine,
-                    engine_backend,
-                ) = resolve_setup_engine_fn(default_engine_override)
+                engine_backend = refresh_engine_backend()
                 setup = transport_backend.check_setup(
                     engine_backend,
                     transport_override=transport_override,
@@ -366,10 +304,7 @@ def app_main(
 ) -> None:
     """Takopi CLI."""
     if ctx.invoked_subcommand is None:
-        run_auto_router = cast(
-            Callable[..., None],
-            _resolve_cli_attr("_run_auto_router") or _run_auto_router,
-        )
+        run_auto_router = _cli_hook("_run_auto_router", _run_auto_router)
         run_auto_router(
             default_engine_override=None,
             transport_override=transport,
@@ -380,6 +315,7 @@ def app_main(
         raise typer.Exit()
 
 
+@cache
 def make_engine_cmd(engine_id: str) -> Callable[..., None]:
     def _cmd(
         final_notify: bool = typer.Option(
@@ -403,10 +339,7 @@ def make_engine_cmd(engine_id: str) -> Callable[..., None]:
             help="Log engine JSONL, Telegram requests, and rendered messages.",
         ),
     ) -> None:
-        run_auto_router = cast(
-            Callable[..., None],
-            _resolve_cli_attr("_run_auto_router") or _run_auto_router,
-        )
+        run_auto_router = _cli_hook("_run_auto_router", _run_auto_router)
         run_auto_router(
             default_engine_override=engine_id,
             transport_override=transport,
@@ -419,8 +352,21 @@ def make_engine_cmd(engine_id: str) -> Callable[..., None]:
     return _cmd
 
 
+_CLI_MODULE: ModuleType | None = None
+
+
 def _resolve_cli_attr(name: str) -> object | None:
-    cli_module = sys.modules.get("yee88.cli")
-    if cli_module is None:
-        return None
-    return getattr(cli_module, name, None)
+    # Only the module is cached: attribute values must stay live so tests
+    # can monkeypatch overrides on `yee88.cli` between calls.
+    global _CLI_MODULE
+    if _CLI_MODULE is None:
+        _CLI_MODULE = sys.modules.get("yee88.cli")
+        if _CLI_MODULE is None:
+            return None
+    return getattr(_CLI_MODULE, name, None)
+
+
+def _cli_hook[T](name: str, default: T) -> T:
+    # Tests override CLI dependencies by monkeypatching `yee88.cli`.
+    override = _resolve_cli_attr(name)
+    return default if override is None else cast(T, override)
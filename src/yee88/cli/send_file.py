@@ -7,7 +7,6 @@ appropriate Telegram API method (sendPhoto vs sendDocument).
 from __future__ import annotations
 
 import mimetypes
-import os
 from functools import partial
 from pathlib import Path
 
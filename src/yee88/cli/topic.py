@@ -3,15 +3,15 @@
 from __future__ import annotations
 
 import asyncio
+import subprocess
 from pathlib import Path
 
 import typer
 
 from ..config import ConfigError, HOME_CONFIG_PATH, load_or_init_config, write_config
-from ..config_migrations import migrate_config
 from ..engines import list_backend_ids
-from ..ids import RESERVED_CHAT_COMMANDS, RESERVED_CLI_COMMANDS
-from ..settings import load_settings, validate_settings_data
+from ..ids import RESERVED_COMMAND_IDS, lowered_ids
+from ..settings import ProjectSettings, load_settings
 from ..telegram.client import TelegramClient
 from ..telegram.topic_state import TopicStateStore, resolve_state_path
 from ..context import RunContext
@@ -22,8 +22,6 @@ from ..utils.git import resolve_default_base, resolve_main_worktree_root
 
 def _get_current_branch(cwd: Path) -> str | None:
     """Get current git branch name."""
-    import subprocess
-
     try:
         result = subprocess.run(
             ["git", "branch", "--show-current"],
@@ -42,33 +40,7 @@ def _get_current_branch(cwd: Path) -> str | None:
 
 def _get_project_root(cwd: Path) -> Path:
     """Get git project root, handling worktrees."""
-    import subprocess
-
-    try:
-        result = subprocess.run(
-            ["git", "rev-parse", "--path-format=absolute", "--git-common-dir"],
-            cwd=cwd,
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-        if result.returncode == 0:
-            common_dir = result.stdout.strip()
-            if common_dir:
-                # Check if bare repo
-                bare_result = subprocess.run(
-                    ["git", "rev-parse", "--is-bare-repository"],
-                    cwd=cwd,
-                    capture_output=True,
-                    text=True,
-                    check=False,
-                )
-                if bare_result.stdout.strip() == "true":
-                    return cwd
-                return Path(common_dir).parent
-    except FileNotFoundError:
-        pass
-    return cwd
+    return resolve_main_worktree_root(cwd) or cwd
 
 
 def _check_alias_conflict(alias: str) -> str | None:
@@ -76,13 +48,12 @@ def _check_alias_conflict(alias: str) -> str | None:
     
     Returns conflict reason if conflicts, None otherwise.
     """
-    reserved = RESERVED_CLI_COMMANDS | RESERVED_CHAT_COMMANDS
-    engine_ids = set(list_backend_ids())
-    
     alias_lower = alias.lower()
-    if alias_lower in engine_ids:
+    # Discover backends on each call so newly installed plugins are seen;
+    # lowered_ids caches the lowered ids per backend tuple.
+    if alias_lower in lowered_ids(tuple(list_backend_ids())):
         return f"engine ID '{alias_lower}'"
-    if alias_lower in reserved:
+    if alias_lower in RESERVED_COMMAND_IDS:
         return f"reserved command '{alias_lower}'"
     return None
 
@@ -202,14 +173,14 @@ def _ensure_project(
     project: str,
     project_root: Path,
     config_path: Path,
-) -> None:
-    """Ensure project is registered in config, auto-init if needed."""
-    config, cfg_path = load_or_init_config()
-    
-    if cfg_path.exists():
-        applied = migrate_config(config, config_path=cfg_path)
-        if applied:
-            write_config(config, cfg_path)
+) -> dict[str, object] | None:
+    """Ensure project is registered in config, auto-init if needed.
+
+    Returns the new project entry when one was written, None otherwise.
+    The caller has already loaded (and migrated) the config at
+    ``config_path``.
+    """
+    config, cfg_path = load_or_init_config(config_path)
     
     projects = config.setdefault("projects", {})
     if not isinstance(projects, dict):
@@ -217,7 +188,7 @@ def _ensure_project(
     
     # Check if project already exists
     if project in projects:
-        return
+        return None
     
     # Auto-init project
     worktree_base = resolve_default_base(project_root)
@@ -232,6 +203,7 @@ def _ensure_project(
     projects[project] = entry
     write_config(config, cfg_path)
     typer.echo(f"auto-registered project '{project}'")
+    return entry
 
 
 def run_topic(
@@ -286,9 +258,12 @@ def run_topic(
     # Auto-init project if not exists (only for create mode)
     if not delete and not project_exists:
         try:
-            _ensure_project(project_key, project_root, cfg_path)
-            # Reload settings after auto-init
-            settings, cfg_path = load_settings(cfg_path)
+            entry = _ensure_project(project_key, project_root, cfg_path)
+            if entry is not None:
+                # Fold the new entry in rather than re-reading the config.
+                projects = dict(settings.projects)
+                projects[project_key] = ProjectSettings.model_validate(entry)
+                settings = settings.model_copy(update={"projects": projects})
         except ConfigError as e:
             typer.echo(f"warning: failed to auto-init project: {e}", err=True)
     
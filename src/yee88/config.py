@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import copy
 import tomllib
 from dataclasses import dataclass, field
 import os
@@ -11,6 +12,10 @@ import tomli_w
 
 HOME_CONFIG_PATH = Path.home() / ".yee88" / "yee88.toml"
 
+# Parsed TOML keyed by path, guarded by the (inode, mtime_ns, size) stamp it was
+# read at. Callers mutate what they get back, so hits are deep-copied.
+_PARSED_CONFIGS: dict[Path, tuple[tuple[int, int, int], dict[str, Any]]] = {}
+
 
 class ConfigError(RuntimeError):
     pass
@@ -34,9 +39,33 @@ def ensure_table(
     return value
 
 
+def config_stamp(cfg_path: Path) -> tuple[int, int, int] | None:
+    """Return ``(st_ino, st_mtime_ns, st_size)`` for ``cfg_path``, or None.
+
+    Two equal stamps mean the file was not replaced or rewritten in between:
+    atomic saves change the inode, in-place edits the mtime or size. None
+    means the file is missing or unreadable.
+    """
+    try:
+        stat = cfg_path.stat()
+    except OSError:
+        return None
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
 def read_config(cfg_path: Path) -> dict:
     if cfg_path.exists() and not cfg_path.is_file():
         raise ConfigError(f"Config path {cfg_path} exists but is not a file.") from None
+    try:
+        stat = cfg_path.stat()
+    except FileNotFoundError:
+        raise ConfigError(f"Missing config file {cfg_path}.") from None
+    except OSError as e:
+        raise ConfigError(f"Failed to read config file {cfg_path}: {e}") from e
+    stamp = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+    cached = _PARSED_CONFIGS.get(cfg_path)
+    if cached is not None and cached[0] == stamp:
+        return copy.deepcopy(cached[1])
     try:
         raw = cfg_path.read_text(encoding="utf-8")
     except FileNotFoundError:
@@ -44,9 +73,11 @@ def read_config(cfg_path: Path) -> dict:
     except OSError as e:
         raise ConfigError(f"Failed to read config file {cfg_path}: {e}") from e
     try:
-        return tomllib.loads(raw)
+        parsed = tomllib.loads(raw)
     except tomllib.TOMLDecodeError as e:
         raise ConfigError(f"Malformed TOML in {cfg_path}: {e}") from None
+    _PARSED_CONFIGS[cfg_path] = (stamp, parsed)
+    return copy.deepcopy(parsed)
 
 
 def load_or_init_config(path: str | Path | None = None) -> tuple[dict, Path]:
@@ -85,6 +116,17 @@ class ProjectsConfig:
     default_project: str | None = None
     system_prompt: str | None = None
     chat_map: dict[int, str] = field(default_factory=dict)
+    engine_keys: frozenset[str] = frozenset()
+    reserved_keys: frozenset[str] = frozenset()
+
+    def alias_conflict(self, alias: str) -> str | None:
+        """Return what a new project alias would collide with, if anything."""
+        key = alias.lower()
+        if key in self.engine_keys:
+            return "engine ids"
+        if key in self.reserved_keys:
+            return "reserved commands"
+        return None
 
     def resolve(self, alias: str | None) -> ProjectConfig | None:
         if alias is None:
@@ -124,6 +166,7 @@ def dump_toml(config: dict[str, Any]) -> str:
 
 
 def write_config(config: dict[str, Any], path: Path) -> None:
+    _PARSED_CONFIGS.pop(path, None)
     path.parent.mkdir(parents=True, exist_ok=True)
     payload = dump_toml(config)
     tmp_path: Path | None = None
@@ -3,11 +3,21 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any
 
-from .config import ConfigError, ensure_table, read_config, write_config
+from .config import (
+    ConfigError,
+    config_stamp,
+    ensure_table,
+    read_config,
+    write_config,
+)
 from .logging import get_logger
 
 logger = get_logger(__name__)
 
+# Stamps of config files already known to need no migration, so repeated
+# loads of an unchanged file skip the read and table walk entirely.
+_MIGRATED_STAMPS: dict[Path, tuple[int, int, int]] = {}
+
 
 def _ensure_subtable(
     parent: dict[str, Any],
@@ -111,14 +121,20 @@ def migrate_config(config: dict[str, Any], *, config_path: Path) -> list[str]:
 
 
 def migrate_config_file(path: Path) -> list[str]:
+    stamp = config_stamp(path)
+    if stamp is not None and _MIGRATED_STAMPS.get(path) == stamp:
+        return []
     config = read_config(path)
     applied = migrate_config(config, config_path=path)
     if applied:
         write_config(config, path)
+        stamp = config_stamp(path)
         for migration in applied:
             logger.info(
                 "config.migrated",
                 migration=migration,
                 path=str(path),
             )
+    if stamp is not None:
+        _MIGRATED_STAMPS[path] = stamp
     return applied
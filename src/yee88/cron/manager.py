@@ -1,20 +1,117 @@
+import builtins
 import tomllib
-import tomli_w
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import Self
 from zoneinfo import ZoneInfo
+
+import tomli_w
 from croniter import croniter
-from datetime import datetime
-from .models import CronJob
+
+from ..config import HOME_CONFIG_PATH, config_stamp
+from ..logging import get_logger
+from ..utils.json_state import atomic_write_bytes
+from .models import CRON_JOB_FIELDS, CronJob
+
+logger = get_logger()
 
 BEIJING_TZ = ZoneInfo("Asia/Shanghai")
 
 
+def _job_from_table(table: object) -> CronJob | None:
+    if not isinstance(table, dict):
+        logger.warning("cron.load.invalid_job", job=repr(table))
+        return None
+    values = {}
+    for key, value in table.items():
+        if key not in CRON_JOB_FIELDS:
+            continue
+        # Hand-edited files may hold bare TOML datetimes or numeric ids.
+        if isinstance(value, (datetime, date, time)):
+            value = value.isoformat()
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            value = str(value)
+        values[key] = value
+    try:
+        return CronJob(**values)
+    except TypeError as exc:
+        logger.warning("cron.load.invalid_job", job_id=values.get("id"), error=str(exc))
+        return None
+
+
+@lru_cache(maxsize=256)
+def _parse_job_time(value: str, tz: ZoneInfo) -> datetime:
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=tz)
+    return parsed
+
+
+_JOB_KEYS = (
+    "id",
+    "schedule",
+    "message",
+    "project",
+    "enabled",
+    "last_run",
+    "next_run",
+    "one_time",
+    "engine",
+    "model",
+)
+
+
+@lru_cache(maxsize=1024)
+def _dump_job(values: tuple[str | bool, ...]) -> str:
+    # Most saves touch one job (a run stamp, an enable toggle); unchanged jobs
+    # reuse their rendered block instead of going through tomli_w again.
+    return "[[jobs]]\n" + tomli_w.dumps(dict(zip(_JOB_KEYS, values, strict=True)))
+
+
 class CronManager:
     def __init__(self, config_dir: Path, timezone: str = "Asia/Shanghai"):
         self.file = config_dir / "cron.toml"
-        self.jobs: List[CronJob] = []
+        self._jobs: list[CronJob] = []
+        self._by_id: dict[str, CronJob] = {}
         self.timezone = ZoneInfo(timezone)
+        self._batch_depth = 0
+        self._dirty = False
+        self._next_fire: dict[str, tuple[str, str, datetime]] = {}
+        self._croniters: dict[str, tuple[str, croniter]] = {}
+        # (inode, mtime_ns, size) of cron.toml as last loaded or saved.
+        self._loaded_stamp: tuple[int, int, int] | None = None
+        self._projects_cache: (
+            tuple[tuple[int, int, int] | None, tuple[str, ...] | None] | None
+        ) = None
+
+    @property
+    def jobs(self) -> builtins.list[CronJob]:
+        # A copy: mutate through add/remove/enable/disable so the id index
+        # stays in step with the list.
+        return builtins.list(self._jobs)
+
+    def _set_jobs(self, jobs: builtins.list[CronJob]) -> None:
+        self._jobs = jobs
+        self._by_id = {job.id: job for job in jobs}
+
+    def __enter__(self) -> Self:
+        self._batch_depth += 1
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._batch_depth -= 1
+        if self._batch_depth == 0:
+            self.flush()
+
+    def _mark_dirty(self) -> None:
+        self._dirty = True
+        if self._batch_depth == 0:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._dirty:
+            self.save()
 
     def _validate_project(self, project: str) -> None:
         if not project:
@@ -24,166 +121,216 @@ class CronManager:
         if path.exists() and path.is_dir():
             return
 
-        from ..settings import load_settings_if_exists
-        from ..engines import list_backend_ids
-
-        result = load_settings_if_exists()
-        if result is None:
+        available = self._known_projects()
+        if available is None:
             return
 
-        settings, config_path = result
-        engine_ids = list_backend_ids()
-        projects_config = settings.to_projects_config(
-            config_path=config_path, engine_ids=engine_ids
-        )
-
-        if project.lower() in projects_config.projects:
+        if project.lower() in available:
             return
 
-        available = list(projects_config.projects.keys())
         if available:
             raise ValueError(f"未知项目: {project}。可用项目: {', '.join(available)}")
         else:
             raise ValueError(f"未知项目: {project}。请先使用 'yee88 init' 注册项目")
 
+    def _known_projects(self) -> tuple[str, ...] | None:
+        from ..engines import list_backend_ids
+        from ..settings import load_settings_if_exists
+
+        stamp = config_stamp(HOME_CONFIG_PATH)
+        cached = self._projects_cache
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        result = load_settings_if_exists()
+        if result is None:
+            known = None
+        else:
+            settings, config_path = result
+            engine_ids = list_backend_ids()
+            projects_config = settings.to_projects_config(
+                config_path=config_path, engine_ids=engine_ids
+            )
+            known = tuple(projects_config.projects)
+        self._projects_cache = (stamp, known)
+        return known
+
     def load(self):
-        if not self.file.exists():
-            self.jobs = []
+        stamp = config_stamp(self.file)
+        if stamp is None:
+            self._set_jobs([])
+            self._loaded_stamp = None
+            return
+        if stamp == self._loaded_stamp:
             return
 
-        with open(self.file, "rb") as f:
-            data = tomllib.load(f)
-
-        self.jobs = [CronJob(**{k: v for k, v in job.items() if k in {'id', 'schedule', 'message', 'project', 'enabled', 'last_run', 'next_run', 'one_time', 'engine', 'model'}}) for job in data.get("jobs", [])]
+        data = tomllib.loads(self.file.read_bytes().decode("utf-8"))
+        jobs = (_job_from_table(table) for table in data.get("jobs", []))
+        self._set_jobs([job for job in jobs if job is not None])
+        self._loaded_stamp = stamp
 
     def save(self):
-        data = {
-            "jobs": [
-                {
-                    "id": job.id,
-                    "schedule": job.schedule,
-                    "message": job.message,
-                    "project": job.project,
-                    "enabled": job.enabled,
-                    "last_run": job.last_run,
-                    "next_run": job.next_run,
-                    "one_time": job.one_time,
-                    "engine": job.engine or "",
-                    "model": job.model or "",
-                }
-                for job in self.jobs
-            ]
-        }
-
-        with open(self.file, "wb") as f:
-            tomli_w.dump(data, f)
+        text = "\n".join(
+            _dump_job(
+                (
+                    job.id,
+                    job.schedule,
+                    job.message,
+                    job.project,
+                    job.enabled,
+                    job.last_run,
+                    job.next_run,
+                    job.one_time,
+                    job.engine or "",
+                    job.model or "",
+                )
+            )
+            for job in self._jobs
+        )
+
+        # Replace atomically so the cron.toml watcher never reads a
+        # half-written file.
+        atomic_write_bytes(self.file, text.encode("utf-8"))
+        self._dirty = False
+        self._loaded_stamp = config_stamp(self.file)
 
     def add(self, job: CronJob) -> None:
         self._validate_project(job.project)
 
-        if any(j.id == job.id for j in self.jobs):
+        if self.get(job.id) is not None:
             raise ValueError(f"任务 ID 已存在: {job.id}")
 
-        self.jobs.append(job)
-        self.save()
+        self._jobs.append(job)
+        self._by_id[job.id] = job
+        self._mark_dirty()
 
     def remove(self, job_id: str) -> bool:
-        original_len = len(self.jobs)
-        self.jobs = [j for j in self.jobs if j.id != job_id]
+        if self.get(job_id) is None:
+            return False
+        self._set_jobs([j for j in self._jobs if j.id != job_id])
+        self._mark_dirty()
+        return True
 
-        if len(self.jobs) < original_len:
-            self.save()
-            return True
-        return False
-
-    def get(self, job_id: str) -> Optional[CronJob]:
-        for job in self.jobs:
-            if job.id == job_id:
-                return job
-        return None
+    def get(self, job_id: str) -> CronJob | None:
+        return self._by_id.get(job_id)
 
-    def list(self) -> List[CronJob]:
+    def list(self) -> builtins.list[CronJob]:
         return self.jobs
 
-    def reload_jobs(self) -> List[str]:
-        old_jobs = {j.id: j for j in self.jobs}
+    def reload_jobs(self) -> builtins.list[str]:
+        old_list = self._jobs
+        old_jobs = self._by_id
         self.load()
-        new_jobs = {j.id: j for j in self.jobs}
+        if self._jobs is old_list:
+            # cron.toml is unchanged since the last load or save.
+            return []
+        new_jobs = self._by_id
 
         changed = []
         for job_id, job in new_jobs.items():
-            if job_id not in old_jobs or old_jobs[job_id] != job:
+            if old_jobs.get(job_id) != job:
                 changed.append(job_id)
         for job_id in old_jobs:
             if job_id not in new_jobs:
                 changed.append(job_id)
+        for job_id in changed:
+            self._croniters.pop(job_id, None)
 
         return changed
 
     def enable(self, job_id: str) -> bool:
-        for job in self.jobs:
-            if job.id == job_id:
-                job.enabled = True
-                self.save()
-                return True
-        return False
+        return self._set_enabled(job_id, True)
 
     def disable(self, job_id: str) -> bool:
-        for job in self.jobs:
-            if job.id == job_id:
-                job.enabled = False
-                self.save()
-                return True
-        return False
-
-    def get_due_jobs(self) -> List[CronJob]:
+        return self._set_enabled(job_id, False)
+
+    def _set_enabled(self, job_id: str, enabled: bool) -> bool:
+        job = self.get(job_id)
+        if job is None:
+            return False
+        if job.enabled != enabled:
+            job.enabled = enabled
+            self._mark_dirty()
+        return True
+
+    def _croniter_at(self, job: CronJob, base: datetime) -> croniter:
+        # Parsing the expression dominates croniter construction, so keep one
+        # iterator per job and just move it to ``base``.
+        cached = self._croniters.get(job.id)
+        if cached is not None and cached[0] == job.schedule:
+            itr = cached[1]
+            itr.set_current(base, force=True)
+            return itr
+        itr = croniter(job.schedule, base)
+        self._croniters[job.id] = (job.schedule, itr)
+        return itr
+
+    def _next_fire_after_last_run(self, job: CronJob) -> datetime:
+        cached = self._next_fire.get(job.id)
+        if cached is not None and cached[:2] == (job.schedule, job.last_run):
+            return cached[2]
+        base = _parse_job_time(job.last_run, self.timezone)
+        next_run = self._croniter_at(job, base).get_next(datetime)
+        self._next_fire[job.id] = (job.schedule, job.last_run, next_run)
+        return next_run
+
+    def next_fire_time(self, job: CronJob, now: datetime) -> datetime:
+        if job.one_time:
+            return _parse_job_time(job.schedule, self.timezone)
+        if job.last_run:
+            return self._next_fire_after_last_run(job)
+        if job.next_run:
+            return _parse_job_time(job.next_run, self.timezone)
+        next_run = self._croniter_at(job, now).get_next(datetime)
+        if next_run.tzinfo is None:
+            next_run = next_run.replace(tzinfo=self.timezone)
+        return next_run
+
+    def _record_run(self, job: CronJob, now: datetime, now_iso: str) -> None:
+        next_run = self._croniter_at(job, now).get_next(datetime)
+        job.last_run = now_iso
+        job.next_run = next_run.isoformat()
+        # Seed the cache so the next tick need not rebuild this croniter.
+        self._next_fire[job.id] = (job.schedule, now_iso, next_run)
+
+    def get_due_jobs(self) -> builtins.list[CronJob]:
         now = datetime.now(self.timezone)
+        now_iso = now.isoformat()
         due = []
-        one_time_completed = []
+        one_time_completed: set[str] = set()
 
-        for job in self.jobs:
+        for job in self._jobs:
             if not job.enabled:
                 continue
 
             if job.one_time:
                 try:
-                    exec_time = datetime.fromisoformat(job.schedule)
-                    if exec_time.tzinfo is None:
-                        exec_time = exec_time.replace(tzinfo=self.timezone)
+                    exec_time = _parse_job_time(job.schedule, self.timezone)
                     if exec_time <= now:
                         due.append(job)
-                        one_time_completed.append(job.id)
+                        one_time_completed.add(job.id)
                 except Exception:
                     continue
             else:
                 try:
                     if job.last_run:
-                        base = datetime.fromisoformat(job.last_run)
-                        if base.tzinfo is None:
-                            base = base.replace(tzinfo=self.timezone)
-                        itr = croniter(job.schedule, base)
-                        next_run = itr.get_next(datetime)
+                        next_run = self._next_fire_after_last_run(job)
                         if next_run <= now:
                             due.append(job)
-                            job.last_run = now.isoformat()
-                            itr_after_run = croniter(job.schedule, now)
-                            job.next_run = itr_after_run.get_next(datetime).isoformat()
+                            self._record_run(job, now, now_iso)
                     else:
-                        itr = croniter(job.schedule, now)
+                        itr = self._croniter_at(job, now)
                         prev_run = itr.get_prev(datetime)
-                        from datetime import timedelta
                         if (now - prev_run) <= timedelta(hours=24):
                             due.append(job)
-                            job.last_run = now.isoformat()
-                            itr_after_run = croniter(job.schedule, now)
-                            job.next_run = itr_after_run.get_next(datetime).isoformat()
+                            self._record_run(job, now, now_iso)
                 except Exception:
                     continue
 
         if one_time_completed:
-            self.jobs = [j for j in self.jobs if j.id not in one_time_completed]
+            self._set_jobs([j for j in self._jobs if j.id not in one_time_completed])
 
         if due:
-            self.save()
+            self._mark_dirty()
 
         return due
@@ -1,8 +1,8 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class CronJob:
     id: str
     schedule: str
@@ -14,3 +14,6 @@ class CronJob:
     one_time: bool = False
     engine: Optional[str] = None
     model: Optional[str] = None
+
+
+CRON_JOB_FIELDS = frozenset(f.name for f in fields(CronJob))
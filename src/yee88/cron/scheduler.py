@@ -1,8 +1,7 @@
 from datetime import datetime
-from typing import Callable, Awaitable, Set, Dict
+from typing import Callable, Awaitable, Set
 from anyio.abc import TaskGroup
 import anyio
-from anyio import Lock
 from .manager import CronManager
 from .models import CronJob
 from ..logging import get_logger
@@ -22,7 +21,7 @@ class CronScheduler:
         self.task_group = task_group
         self.running = False
         self._running_jobs: Set[str] = set()
-        self._job_locks: Dict[str, Lock] = {}
+        self._wakeup: anyio.Event | None = None
 
     def _calculate_next_check(self) -> float:
         now = datetime.now(self.manager.timezone)
@@ -34,33 +33,14 @@ class CronScheduler:
         for job in self.manager.jobs:
             if not job.enabled:
                 continue
-
             try:
-                if job.one_time:
-                    exec_time = datetime.fromisoformat(job.schedule)
-                    if exec_time.tzinfo is None:
-                        exec_time = exec_time.replace(tzinfo=self.manager.timezone)
-                    if exec_time > now:
-                        if earliest_next_run is None or exec_time < earliest_next_run:
-                            earliest_next_run = exec_time
-                else:
-                    if job.next_run:
-                        next_run = datetime.fromisoformat(job.next_run)
-                        if next_run.tzinfo is None:
-                            next_run = next_run.replace(tzinfo=self.manager.timezone)
-                    else:
-                        from croniter import croniter
-
-                        itr = croniter(job.schedule, now)
-                        next_run = itr.get_next(datetime)
-                        if next_run.tzinfo is None:
-                            next_run = next_run.replace(tzinfo=self.manager.timezone)
-
-                    if next_run > now:
-                        if earliest_next_run is None or next_run < earliest_next_run:
-                            earliest_next_run = next_run
+                next_run = self.manager.next_fire_time(job, now)
             except Exception:
                 continue
+            if next_run > now and (
+                earliest_next_run is None or next_run < earliest_next_run
+            ):
+                earliest_next_run = next_run
 
         if earliest_next_run is None:
             return max_sleep
@@ -70,7 +50,12 @@ class CronScheduler:
 
     async def start(self):
         self.running = True
-        self.manager.load()
+        try:
+            self.manager.load()
+        except (OSError, ValueError) as exc:
+            # A broken cron.toml must not take the bot down; the watcher
+            # reloads it once the file is fixed.
+            logger.error("cron.scheduler.load_failed", error=str(exc))
         logger.info("cron.scheduler.started", job_count=len(self.manager.jobs))
 
         # Debug: log all jobs and their next_run times
@@ -87,6 +72,9 @@ class CronScheduler:
         cycle = 0
         while self.running:
             cycle += 1
+            # Fresh event before checking jobs, so a wake() that lands while
+            # this cycle runs still cuts the following sleep short.
+            self._wakeup = anyio.Event()
             sleep_seconds = self._calculate_next_check()
 
             if sleep_seconds > 5:
@@ -118,20 +106,13 @@ class CronScheduler:
                 self.task_group.start_soon(self._run_job_safe, job)
 
             logger.info("cron.scheduler.sleeping", cycle=cycle, seconds=sleep_seconds)
-            await anyio.sleep(sleep_seconds)
+            with anyio.move_on_after(sleep_seconds):
+                await self._wakeup.wait()
 
     def _acquire_job_lock(self, job_id: str) -> bool:
         if job_id in self._running_jobs:
             return False
 
-        if job_id not in self._job_locks:
-            self._job_locks[job_id] = Lock()
-
-        job_lock = self._job_locks[job_id]
-
-        if job_lock.locked():
-            return False
-
         self._running_jobs.add(job_id)
         return True
 
@@ -152,6 +133,12 @@ class CronScheduler:
         finally:
             self._release_job_lock(job.id)
 
+    def wake(self) -> None:
+        """Re-check jobs now instead of at the end of the current sleep."""
+        if self._wakeup is not None:
+            self._wakeup.set()
+
     def stop(self):
         self.running = False
+        self.wake()
         logger.info("cron.scheduler.stopped")
@@ -22,9 +22,16 @@ async def watch_cron_config(
     logger.info("cron.watch.started", path=str(cron_file))
 
     try:
-        async for changes in awatch(str(cron_file)):
+        # Watch the directory: saves replace cron.toml, which would orphan a
+        # watch held on the file itself. Only its top level, and only events
+        # for cron.toml, so unrelated churn under ~/.yee88 stays quiet.
+        async for changes in awatch(
+            cron_file.parent,
+            recursive=False,
+            watch_filter=lambda _change, path: Path(path).name == cron_file.name,
+        ):
             for change_type, path in changes:
-                if Path(path).name == "cron.toml":
+                if Path(path).name == cron_file.name:
                     logger.info(
                         "cron.watch.file_changed",
                         path=path,
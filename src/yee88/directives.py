@@ -1,11 +1,20 @@
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
 
 from .config import ProjectsConfig
 from .context import RunContext
+from .ids import lowered_ids
 from .model import EngineId
 
+# One `ctx: <project> [@branch]` footer line, optionally wrapped in backticks.
+# `[^\S\n]` keeps the whitespace matches from running onto the next line.
+_CTX_LINE_RE = re.compile(
+    r"^[^\S\n]*`?[^\S\n]*ctx:[^\S\n]*(.*?)[^\S\n]*`?[^\S\n]*$",
+    re.IGNORECASE | re.MULTILINE,
+)
+
 
 @dataclass(frozen=True, slots=True)
 class ParsedDirectives:
@@ -34,12 +43,12 @@ def parse_directives(
         return ParsedDirectives(prompt=text, engine=None, project=None, branch=None)
 
     line = lines[idx].lstrip()
-    tokens = line.split()
-    if not tokens:
+    if line[0] not in ("/", "@"):
         return ParsedDirectives(prompt=text, engine=None, project=None, branch=None)
+    tokens = line.split()
 
-    engine_map = {engine.lower(): engine for engine in engine_ids}
-    project_map = {alias.lower(): alias for alias in projects.projects}
+    engine_map = lowered_ids(tuple(engine_ids))
+    project_map = lowered_ids(tuple(projects.projects))
 
     engine: EngineId | None = None
     project: str | None = None
@@ -101,17 +110,8 @@ def parse_context_line(
     if not text:
         return None
     ctx: RunContext | None = None
-    for line in text.splitlines():
-        stripped = line.strip()
-        if stripped.startswith("`") and stripped.endswith("`") and len(stripped) > 1:
-            stripped = stripped[1:-1].strip()
-        elif stripped.startswith("`"):
-            stripped = stripped[1:].strip()
-        elif stripped.endswith("`"):
-            stripped = stripped[:-1].strip()
-        if not stripped.lower().startswith("ctx:"):
-            continue
-        content = stripped.split(":", 1)[1].strip()
+    for match in _CTX_LINE_RE.finditer(text):
+        content = match.group(1)
         if not content:
             continue
         tokens = content.split()
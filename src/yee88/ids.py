@@ -1,13 +1,27 @@
 from __future__ import annotations
 
 import re
+from collections.abc import Mapping
+from functools import lru_cache
+from types import MappingProxyType
 
 ID_PATTERN = r"^[a-z0-9_]{1,32}$"
 _ID_RE = re.compile(ID_PATTERN)
 
 RESERVED_CLI_COMMANDS = frozenset({"config", "doctor", "init", "plugins"})
 RESERVED_CHAT_COMMANDS = frozenset(
-    {"cancel", "file", "new", "fork", "agent", "model", "reasoning", "trigger", "topic", "ctx"}
+    {
+        "cancel",
+        "file",
+        "new",
+        "fork",
+        "agent",
+        "model",
+        "reasoning",
+        "trigger",
+        "topic",
+        "ctx",
+    }
 )
 RESERVED_ENGINE_IDS = RESERVED_CLI_COMMANDS | RESERVED_CHAT_COMMANDS
 RESERVED_COMMAND_IDS = RESERVED_CLI_COMMANDS | RESERVED_CHAT_COMMANDS
@@ -15,3 +29,12 @@ RESERVED_COMMAND_IDS = RESERVED_CLI_COMMANDS | RESERVED_CHAT_COMMANDS
 
 def is_valid_id(value: str) -> bool:
     return bool(_ID_RE.fullmatch(value))
+
+
+@lru_cache(maxsize=32)
+def lowered_ids(names: tuple[str, ...]) -> Mapping[str, str]:
+    """Map each lowercased engine id or project alias to its original spelling.
+
+    Cached per ``names`` tuple, so the mapping is read-only.
+    """
+    return MappingProxyType({name.lower(): name for name in names})
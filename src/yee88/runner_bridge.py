@@ -3,8 +3,10 @@ from __future__ import annotations
 import time
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
+from functools import partial
 
 import anyio
+from anyio import to_thread
 
 from .context import RunContext
 from .logging import bind_run_context, get_logger
@@ -26,6 +28,10 @@ from .transport import (
 
 logger = get_logger(__name__)
 
+# Answers at least this long are rendered in a worker thread; markdown parsing
+# and splitting a long answer would otherwise stall every other run's edits.
+THREADED_RENDER_MIN_CHARS = 4096
+
 
 def _effective_model(runner: Runner) -> str | None:
     run_options = get_run_options()
@@ -633,12 +639,17 @@ async def handle_message(
         context_line=context_line,
         model=_effective_model(runner),
     )
-    final_rendered = cfg.presenter.render_final(
+    render_final = partial(
+        cfg.presenter.render_final,
         state,
         elapsed_s=elapsed,
         status=status,
         answer=final_answer,
     )
+    if len(final_answer) >= THREADED_RENDER_MIN_CHARS:
+        final_rendered = await to_thread.run_sync(render_final)
+    else:
+        final_rendered = render_final()
     logger.debug(
         "handle.final.rendered",
         rendered=final_rendered.text,
@@ -24,6 +24,7 @@ from .config import (
     ProjectsConfig,
 )
 from .config_migrations import migrate_config_file
+from .ids import lowered_ids
 
 
 NonEmptyStr = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
@@ -232,15 +233,15 @@ class TakopiSettings(BaseSettings):
         default_project = self.default_project
         default_chat_id = self.transports.telegram.chat_id
 
-        reserved_lower = {value.lower() for value in reserved}
-        engine_map = {engine.lower(): engine for engine in engine_ids}
+        reserved_lower = frozenset(value.lower() for value in reserved)
+        engine_keys = frozenset(lowered_ids(tuple(engine_ids)))
         projects: dict[str, ProjectConfig] = {}
         chat_map: dict[int, str] = {}
 
         for raw_alias, entry in self.projects.items():
             alias = raw_alias
             alias_key = alias.lower()
-            if alias_key in engine_map or alias_key in reserved_lower:
+            if alias_key in engine_keys or alias_key in reserved_lower:
                 raise ConfigError(
                     f"Invalid project alias {alias!r} in {config_path}; "
                     "aliases must not match engine ids or reserved commands."
@@ -310,6 +311,8 @@ class TakopiSettings(BaseSettings):
             default_project=default_project,
             system_prompt=self.system_prompt,
             chat_map=chat_map,
+            engine_keys=engine_keys,
+            reserved_keys=reserved_lower,
         )
 
 
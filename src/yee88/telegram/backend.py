@@ -42,9 +42,10 @@ def _build_startup_message(
     config_path: Path | None = None,
 ) -> str:
     # Collect engine warnings so the user knows if something is broken.
-    missing_engines = list(runtime.missing_engine_ids())
-    misconfigured_engines = list(runtime.engine_ids_with_status("bad_config"))
-    failed_engines = list(runtime.engine_ids_with_status("load_error"))
+    by_status = runtime.engine_ids_by_status()
+    missing_engines = by_status.get("missing_cli", ())
+    misconfigured_engines = by_status.get("bad_config", ())
+    failed_engines = by_status.get("load_error", ())
 
     warnings: list[str] = []
     if missing_engines:
@@ -58,6 +58,7 @@ class TelegramPresenter:
     ) -> None:
         self._formatter = formatter or MarkdownFormatter()
         self._message_overflow = message_overflow
+        self._last_progress: tuple[MarkdownParts, str, tuple[dict, ...]] | None = None
 
     def render_progress(
         self,
@@ -69,11 +70,24 @@ class TelegramPresenter:
         parts = self._formatter.render_progress_parts(
             state, elapsed_s=elapsed_s, label=label
         )
-        text, entities = prepare_telegram(parts)
+        # Events that leave the visible text unchanged (same second, same
+        # actions) skip the markdown -> entities conversion.
+        cached = self._last_progress
+        if cached is not None and cached[0] == parts:
+            _, text, entities = cached
+        else:
+            text, rendered_entities = prepare_telegram(parts)
+            entities = tuple(rendered_entities)
+            self._last_progress = (parts, text, entities)
         reply_markup = CLEAR_MARKUP if _is_cancelled_label(label) else CANCEL_MARKUP
+        # Each message gets its own entity list, so a caller editing one
+        # payload cannot change what later edits send.
         return RenderedMessage(
             text=text,
-            extra={"entities": entities, "reply_markup": reply_markup},
+            extra={
+                "entities": [dict(entity) for entity in entities],
+                "reply_markup": reply_markup,
+            },
         )
 
     def render_final(
@@ -160,6 +174,17 @@ class TelegramTransport:
             return []
         return [item for item in followups if isinstance(item, RenderedMessage)]
 
+    @staticmethod
+    def _followup_targets(
+        message: RenderedMessage,
+    ) -> tuple[int | None, int | None, bool]:
+        extra = message.extra
+        return (
+            cast(int | None, extra.get("followup_reply_to_message_id")),
+            cast(int | None, extra.get("followup_thread_id")),
+            bool(extra.get("followup_notify", True)),
+        )
+
     async def _send_followups(
         self,
         *,
@@ -192,11 +217,12 @@ class TelegramTransport:
         options: SendOptions | None = None,
     ) -> MessageRef | None:
         chat_id = cast(int, channel_id)
-        reply_to_message_id: int | None = None
         replace_message_id: int | None = None
-        message_thread_id: int | None = None
-        notify = True
-        if options is not None:
+        if options is None:
+            reply_to_message_id, message_thread_id, notify = self._followup_targets(
+                message
+            )
+        else:
             reply_to_message_id = (
                 cast(int, options.reply_to.message_id)
                 if options.reply_to is not None
@@ -208,21 +234,7 @@ class TelegramTransport:
                 else None
             )
             notify = options.notify
-            message_thread_id = (
-                cast(int | None, options.thread_id)
-                if options.thread_id is not None
-                else None
-            )
-        else:
-            reply_to_message_id = cast(
-                int | None,
-                message.extra.get("followup_reply_to_message_id"),
-            )
-            message_thread_id = cast(
-                int | None,
-                message.extra.get("followup_thread_id"),
-            )
-            notify = bool(message.extra.get("followup_notify", True))
+            message_thread_id = cast(int | None, options.thread_id)
         followups = self._extract_followups(message)
         # Send photo URLs extracted from the answer before the text message
         photo_urls = message.extra.get("photo_urls")
@@ -290,13 +302,9 @@ class TelegramTransport:
         if edited is None:
             return ref if not wait else None
         if followups:
-            reply_to_message_id = cast(
-                int | None, message.extra.get("followup_reply_to_message_id")
-            )
-            message_thread_id = cast(
-                int | None, message.extra.get("followup_thread_id")
+            reply_to_message_id, message_thread_id, notify = self._followup_targets(
+                message
             )
-            notify = bool(message.extra.get("followup_notify", True))
             await self._send_followups(
                 chat_id=chat_id,
                 followups=followups,
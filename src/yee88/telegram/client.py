@@ -75,6 +75,7 @@ class TelegramClient:
             on_outbox_error=self.log_outbox_failure,
         )
         self._seq = itertools.count()
+        self._me: User | None = None
 
     def interval_for_chat(self, chat_id: int | None) -> float:
         if chat_id is None:
@@ -373,16 +374,24 @@ class TelegramClient:
         )
 
     async def get_me(self) -> User | None:
+        # The bot's identity is fixed for a token; startup asks for it more
+        # than once (topics validation, trigger mode), so fetch it only once.
+        if self._me is not None:
+            return self._me
+
         async def execute() -> User | None:
             return await self._client.get_me()
 
-        return await self.enqueue_op(
+        me = await self.enqueue_op(
             key=self.unique_key("get_me"),
             label="get_me",
             execute=execute,
             priority=SEND_PRIORITY,
             chat_id=None,
         )
+        if me is not None:
+            self._me = me
+        return me
 
     async def answer_callback_query(
         self,
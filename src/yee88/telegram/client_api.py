@@ -12,6 +12,9 @@ logger = get_logger(__name__)
 
 T = TypeVar("T")
 
+# Shared by every sendMessage/editMessageText payload; never mutated.
+_LINK_PREVIEW_DISABLED: dict[str, Any] = {"is_disabled": True}
+
 
 class RetryAfter(Exception):
     def __init__(self, retry_after: float, description: str | None = None) -> None:
@@ -420,7 +423,7 @@ class HttpBotClient:
             params["entities"] = entities
         if parse_mode is not None:
             params["parse_mode"] = parse_mode
-        params["link_preview_options"] = {"is_disabled": True}
+        params["link_preview_options"] = _LINK_PREVIEW_DISABLED
         if reply_markup is not None:
             params["reply_markup"] = reply_markup
         result = await self._post("sendMessage", params)
@@ -522,7 +525,7 @@ class HttpBotClient:
             params["entities"] = entities
         if parse_mode is not None:
             params["parse_mode"] = parse_mode
-        params["link_preview_options"] = {"is_disabled": True}
+        params["link_preview_options"] = _LINK_PREVIEW_DISABLED
         if reply_markup is not None:
             params["reply_markup"] = reply_markup
         result = await self._post("editMessageText", params)
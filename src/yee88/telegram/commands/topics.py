@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING
 
 from ...context import RunContext
 from ...markdown import MarkdownParts
+from ...model import ResumeToken
 from ...transport_runtime import TransportRuntime
 from ...transport import RenderedMessage, SendOptions
 from ..chat_prefs import ChatPrefsStore
@@ -365,8 +366,6 @@ async def _handle_fork_command(
     resolved_scope: str | None = None,
     scope_chat_ids: frozenset[int] | None = None,
 ) -> None:
-    from ...model import ResumeToken
-
     reply = make_reply(cfg, msg)
     error = _topics_command_error(
         cfg,
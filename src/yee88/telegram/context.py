@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING
 
 from ..context import RunContext
 from ..transport_runtime import TransportRuntime
+from .files import split_command_args
 from .topic_state import TopicThreadSnapshot
 from .topics import _topics_scope_label
 
@@ -48,8 +49,6 @@ def _parse_project_branch_args(
     require_branch: bool,
     chat_project: str | None,
 ) -> tuple[RunContext | None, str | None]:
-    from .files import split_command_args
-
     tokens = split_command_args(args_text)
     if not tokens:
         return (
@@ -17,16 +17,18 @@ from ..config_watch import ConfigReload, watch_config as watch_config_changes
 from ..cron.manager import CronManager
 from ..cron.scheduler import CronScheduler
 from ..cron.models import CronJob
+from ..cron.watch import watch_cron_config
 from ..commands import list_command_ids
 from ..directives import DirectiveError
 from ..logging import get_logger
+from ..markdown import MarkdownParts
 from ..model import ActionEvent, EngineId, ResumeToken
 from ..resume_cache import ResumeTokenCache
 from ..runners.run_options import EngineRunOptions
 from ..scheduler import ThreadJob, ThreadScheduler
 from ..progress import ProgressTracker
 from ..settings import TelegramTransportSettings
-from ..transport import MessageRef, SendOptions
+from ..transport import MessageRef, RenderedMessage, SendOptions
 from ..transport_runtime import ResolvedMessage
 from ..context import RunContext
 from ..ids import RESERVED_CHAT_COMMANDS
@@ -66,6 +68,7 @@ from .commands.parse import is_cancel_command
 from .commands.reply import make_reply
 from .context import _format_context, _merge_topic_context, _usage_ctx_set, _usage_topic
 from .files import format_bytes
+from .render import prepare_telegram
 from .topics import (
     _maybe_rename_topic,
     _resolve_topics_scope,
@@ -126,10 +129,9 @@ async def _resolve_engine_run_options(
     topic_override = None
     topic_system_prompt: str | None = None
     if topic_store is not None and thread_id is not None:
-        topic_override = await topic_store.get_engine_override(
+        topic_override, topic_system_prompt = await topic_store.get_run_overrides(
             chat_id, thread_id, engine
         )
-        topic_system_prompt = await topic_store.get_system_prompt(chat_id, thread_id)
     chat_override = None
     # When running inside a topic (thread_id is set), do NOT fall back
     # to chat-level overrides – each topic should be independent.
@@ -158,10 +160,6 @@ def _allowed_chat_ids(cfg: TelegramBridgeConfig) -> set[int]:
 
 
 async def _send_startup(cfg: TelegramBridgeConfig) -> None:
-    from ..markdown import MarkdownParts
-    from ..transport import RenderedMessage
-    from .render import prepare_telegram
-
     logger.debug("startup.message", text=cfg.startup_msg)
     parts = MarkdownParts(header=cfg.startup_msg)
     text, entities = prepare_telegram(parts)
@@ -841,7 +839,9 @@ class MediaGroupBuffer:
 
 
 def _diff_keys(old: dict[str, object], new: dict[str, object]) -> list[str]:
-    keys = set(old) | set(new)
+    if old == new:
+        return []
+    keys = old.keys() | new.keys()
     return sorted(key for key in keys if old.get(key) != new.get(key))
 
 
@@ -1126,11 +1126,6 @@ async def run_main_loop(
 
                 async def _execute_cron_job(job: CronJob) -> None:
                     try:
-                        from ..model import EngineId
-                        from ..markdown import MarkdownParts
-                        from ..transport import RenderedMessage, SendOptions
-                        from .render import prepare_telegram
-
                         context = (
                             RunContext(project=job.project) if job.project else None
                         )
@@ -1203,14 +1198,18 @@ async def run_main_loop(
 
                 tg.start_soon(run_cron_scheduler)
 
-                from ..cron.watch import watch_cron_config
-
                 cron_file = config_path.parent / "cron.toml"
 
+                async def handle_cron_reload(changed_jobs: list[str]) -> None:
+                    # A job added or rescheduled may be due before the
+                    # scheduler's current sleep ends.
+                    cron_scheduler.wake()
+
                 async def run_cron_watch() -> None:
                     await watch_cron_config(
                         cron_file=cron_file,
                         manager=cron_manager,
+                        on_reload=handle_cron_reload,
                     )
 
                 tg.start_soon(run_cron_watch)
@@ -1848,7 +1847,7 @@ async def run_main_loop(
                     else None
                 )
                 chat_bound_context = None
-                if state.chat_prefs is not None:
+                if bound_context is None and state.chat_prefs is not None:
                     chat_bound_context = await state.chat_prefs.get_context(chat_id)
                 if bound_context is not None:
                     ambient_context = _merge_topic_context(
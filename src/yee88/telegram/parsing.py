@@ -54,6 +54,12 @@ def _parse_incoming_message(
     chat_id: int | None = None,
     chat_ids: set[int] | None = None,
 ) -> TelegramIncomingMessage | None:
+    msg_chat_id = msg.chat.id
+    allowed = chat_ids
+    if allowed is None and chat_id is not None:
+        allowed = {chat_id}
+    if allowed is not None and msg_chat_id not in allowed:
+        return None
     raw_text = msg.text
     caption = msg.caption
     text = raw_text if raw_text is not None else caption
@@ -89,14 +95,8 @@ def _parse_incoming_message(
     has_text = raw_text is not None or caption is not None
     if not has_text and voice_payload is None and document_payload is None:
         return None
-    msg_chat_id = msg.chat.id
     chat_type = msg.chat.type
     is_forum = msg.chat.is_forum
-    allowed = chat_ids
-    if allowed is None and chat_id is not None:
-        allowed = {chat_id}
-    if allowed is not None and msg_chat_id not in allowed:
-        return None
     reply = msg.reply_to_message
     reply_to_message_id = reply.message_id if reply is not None else None
     reply_to_text = reply.text if reply is not None else None
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import re
+import threading
 from dataclasses import dataclass
 from typing import Any
 
@@ -11,7 +12,9 @@ from ..markdown import MarkdownParts, assemble_markdown_parts
 
 MAX_BODY_CHARS = 3500
 
-_MD_RENDERER = MarkdownIt("commonmark", {"html": False})
+# Long final answers render in worker threads (runner_bridge) while progress
+# renders on the event loop, so each thread gets its own MarkdownIt.
+_MD_LOCAL = threading.local()
 _BULLET_RE = re.compile(r"(?m)^(\s*)•")
 _FENCE_RE = re.compile(r"^(?P<indent>[ \t]*)(?P<fence>[`~]{3,})(?P<info>.*)$")
 _IMAGE_RE = re.compile(r"!\[([^\]]*)\]\((https?://[^)]+)\)")
@@ -44,8 +47,16 @@ def extract_image_urls(text: str) -> tuple[str, list[str]]:
     return cleaned, urls
 
 
+def _md_renderer() -> MarkdownIt:
+    renderer = getattr(_MD_LOCAL, "renderer", None)
+    if renderer is None:
+        renderer = MarkdownIt("commonmark", {"html": False})
+        _MD_LOCAL.renderer = renderer
+    return renderer
+
+
 def render_markdown(md: str) -> tuple[str, list[dict[str, Any]]]:
-    html = _MD_RENDERER.render(md or "")
+    html = _md_renderer().render(md or "")
     rendered = transform_html(html)
 
     text = _BULLET_RE.sub(r"\1-", rendered.text)
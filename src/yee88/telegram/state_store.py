@@ -7,7 +7,7 @@ from typing import Any, Protocol
 import anyio
 import msgspec
 
-from ..utils.json_state import atomic_write_json
+from ..utils.json_state import atomic_write_bytes
 
 
 class _Logger(Protocol):
@@ -83,6 +83,6 @@ class JsonStateStore[T: _VersionedState]:
         self._state = payload
 
     def _save_locked(self) -> None:
-        payload = msgspec.to_builtins(self._state)
-        atomic_write_json(self._path, payload)
+        payload = msgspec.json.encode(self._state, order="sorted")
+        atomic_write_bytes(self._path, msgspec.json.format(payload, indent=2) + b"\n")
         self._mtime_ns = self._stat_mtime_ns()
@@ -230,6 +230,25 @@ class TopicStateStore(JsonStateStore[_TopicState]):
             override = thread.engine_overrides.get(engine_key)
             return normalize_overrides(override)
 
+    async def get_run_overrides(
+        self, chat_id: int, thread_id: int, engine: str
+    ) -> tuple[EngineOverrides | None, str | None]:
+        engine_key = _normalize_engine_id(engine)
+        async with self._lock:
+            self._reload_locked_if_needed()
+            thread = self._get_thread_locked(chat_id, thread_id)
+            if thread is None:
+                return None, None
+            override = (
+                thread.engine_overrides.get(engine_key)
+                if engine_key is not None
+                else None
+            )
+            return (
+                normalize_overrides(override),
+                _normalize_text(thread.system_prompt),
+            )
+
     async def set_default_engine(
         self, chat_id: int, thread_id: int, engine: str | None
     ) -> None:
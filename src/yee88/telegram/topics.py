@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING
 
 from ..config import ConfigError
 from ..context import RunContext
+from ..logging import get_logger
 from ..settings import TelegramTopicsSettings
 from ..transport_runtime import TransportRuntime
 from .client import BotClient
@@ -14,6 +15,8 @@ from .types import TelegramIncomingMessage
 if TYPE_CHECKING:
     from .bridge import TelegramBridgeConfig
 
+logger = get_logger(__name__)
+
 __all__ = [
     "_TOPICS_COMMANDS",
     "_maybe_rename_topic",
@@ -153,9 +156,6 @@ async def _maybe_rename_topic(
         name=title,
     )
     if not updated:
-        from ..logging import get_logger
-
-        logger = get_logger(__name__)
         logger.warning(
             "topics.rename.failed",
             chat_id=chat_id,
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import Literal
 
+from ..ids import lowered_ids
 from ..transport_runtime import TransportRuntime
 from .chat_prefs import ChatPrefsStore
 from .commands.parse import _parse_slash_command
@@ -61,8 +62,6 @@ def should_trigger_run(
         return False
     if command_id in reserved_chat_commands or command_id in command_ids:
         return True
-    engine_ids = {engine.lower() for engine in runtime.available_engine_ids()}
-    if command_id in engine_ids:
+    if command_id in lowered_ids(runtime.available_engine_ids()):
         return True
-    project_aliases = {alias.lower() for alias in runtime.project_aliases()}
-    return command_id in project_aliases
+    return command_id in lowered_ids(runtime.project_aliases())
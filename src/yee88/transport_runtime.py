@@ -162,6 +162,12 @@ class TransportRuntime:
             entry.engine for entry in self._router.entries if entry.status == status
         )
 
+    def engine_ids_by_status(self) -> dict[EngineStatus, tuple[EngineId, ...]]:
+        grouped: dict[EngineStatus, list[EngineId]] = {}
+        for entry in self._router.entries:
+            grouped.setdefault(entry.status, []).append(entry.engine)
+        return {status: tuple(engines) for status, engines in grouped.items()}
+
     def missing_engine_ids(self) -> tuple[EngineId, ...]:
         return self.engine_ids_with_status("missing_cli")
 
@@ -73,15 +73,22 @@ def resolve_default_base(root: Path) -> str | None:
 
 
 def resolve_main_worktree_root(cwd: Path) -> Path | None:
-    common_dir = git_stdout(
-        ["rev-parse", "--path-format=absolute", "--git-common-dir"],
+    # One rev-parse answers both questions: common dir, then bare-ness.
+    output = git_stdout(
+        [
+            "rev-parse",
+            "--path-format=absolute",
+            "--git-common-dir",
+            "--is-bare-repository",
+        ],
         cwd=cwd,
     )
-    if not common_dir:
+    if not output:
         return None
-    if git_stdout(["rev-parse", "--is-bare-repository"], cwd=cwd) == "true":
+    common_dir, _, is_bare = output.partition("\n")
+    if is_bare.strip() == "true":
         return cwd
-    common_path = Path(common_dir)
+    common_path = Path(common_dir.strip())
     if not common_path.is_absolute():
         common_path = (cwd / common_path).resolve()
     return common_path.parent
@@ -13,9 +13,13 @@ def atomic_write_json(
     indent: int = 2,
     sort_keys: bool = True,
 ) -> None:
+    data = json.dumps(payload, indent=indent, sort_keys=sort_keys) + "\n"
+    atomic_write_bytes(path, data.encode("utf-8"))
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     tmp_path = path.with_suffix(f"{path.suffix}.tmp")
-    with open(tmp_path, "w", encoding="utf-8") as handle:
-        json.dump(payload, handle, indent=indent, sort_keys=sort_keys)
-        handle.write("\n")
+    with open(tmp_path, "wb") as handle:
+        handle.write(data)
     os.replace(tmp_path, path)
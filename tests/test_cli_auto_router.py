@@ -33,7 +33,7 @@ class _FakeTransport:
         self.check_calls.append((engine_backend, transport_override))
         return self._setup
 
-    def interactive_setup(self, *, force: bool) -> bool:
+    async def interactive_setup(self, *, force: bool) -> bool:
         _ = force
         return True
 
@@ -176,3 +176,55 @@ def test_run_auto_router_missing_config_noninteractive(
 
     assert exc.value.exit_code == 1
     assert not transport.build_calls
+
+
+@pytest.mark.parametrize(
+    ("writes_config", "expected_calls"),
+    [(False, 1), (True, 2)],
+)
+def test_run_auto_router_onboard_reresolves_only_on_config_change(
+    monkeypatch, tmp_path: Path, writes_config: bool, expected_calls: int
+) -> None:
+    from yee88.cli import run as run_mod
+
+    config_path = tmp_path / "yee88.toml"
+    setup = SetupResult(issues=[], config_path=config_path)
+
+    class _OnboardingTransport(_FakeTransport):
+        async def interactive_setup(self, *, force: bool) -> bool:
+            _ = force
+            if writes_config:
+                config_path.write_text('transport = "telegram"\n', encoding="utf-8")
+            return True
+
+    transport = _OnboardingTransport(setup)
+    resolve_calls: list[str | None] = []
+
+    def _resolve(override):
+        resolve_calls.append(override)
+        return (None, None, None, "codex", _engine_backend())
+
+    monkeypatch.setattr(run_mod, "HOME_CONFIG_PATH", config_path)
+    monkeypatch.setattr(cli, "_resolve_setup_engine", _resolve)
+    monkeypatch.setattr(cli, "_resolve_transport_id", lambda _override: "fake")
+    monkeypatch.setattr(cli, "get_transport", lambda _id, allowlist=None: transport)
+    monkeypatch.setattr(cli, "_should_run_interactive", lambda: True)
+    monkeypatch.setattr(cli, "setup_logging", lambda **_kwargs: None)
+    monkeypatch.setattr(cli, "load_settings", lambda: (_settings(), config_path))
+    monkeypatch.setattr(
+        cli,
+        "build_runtime_spec",
+        lambda **_kwargs: type("_Spec", (), {"to_runtime": lambda *_a, **_k: None})(),
+    )
+    monkeypatch.setattr(cli, "acquire_config_lock", lambda _path, _token: _DummyLock())
+
+    cli._run_auto_router(
+        default_engine_override=None,
+        transport_override=None,
+        final_notify=True,
+        debug=False,
+        onboard=True,
+    )
+
+    assert len(resolve_calls) == expected_calls
+    assert transport.build_calls
@@ -68,3 +68,37 @@ def test_chat_id_command_uses_config_token(monkeypatch) -> None:
 
     assert result.exit_code == 0
     assert "chat_id = 321" in result.output
+
+
+def test_chat_id_command_matches_project_case_insensitively(
+    monkeypatch, tmp_path
+) -> None:
+    config_path = tmp_path / "yee88.toml"
+    config_path.write_text(
+        '[projects.Z80]\npath = "/tmp/repo"\n',
+        encoding="utf-8",
+    )
+    monkeypatch.setattr("yee88.config.HOME_CONFIG_PATH", config_path)
+    monkeypatch.setattr(cli, "_load_settings_optional", lambda: (None, None))
+
+    async def _capture(*, token: str | None = None):
+        _ = token
+        return onboarding.ChatInfo(
+            chat_id=456,
+            username=None,
+            title="yee88",
+            first_name=None,
+            last_name=None,
+            chat_type="supergroup",
+        )
+
+    monkeypatch.setattr(cli.onboarding, "capture_chat_id", _capture)
+
+    runner = CliRunner()
+    result = runner.invoke(
+        cli.create_app(),
+        ["chat-id", "--token", "token", "--project", "z80"],
+    )
+
+    assert result.exit_code == 0
+    assert "updated projects.Z80.chat_id = 456" in result.output
@@ -74,6 +74,28 @@ def test_init_declines_overwrite(monkeypatch, tmp_path: Path) -> None:
     assert result.exit_code == 1
 
 
+def test_init_rejects_engine_alias(monkeypatch, tmp_path: Path) -> None:
+    config = _min_config()
+    config_path = tmp_path / "yee88.toml"
+    repo_path = tmp_path / "repo"
+    repo_path.mkdir()
+    monkeypatch.chdir(repo_path)
+
+    monkeypatch.setattr(cli, "load_or_init_config", lambda: (config, config_path))
+    monkeypatch.setattr(cli, "resolve_main_worktree_root", lambda _path: None)
+    monkeypatch.setattr(cli, "resolve_default_base", lambda _path: None)
+    monkeypatch.setattr(cli, "list_backend_ids", lambda allowlist=None: ["Codex"])
+    monkeypatch.setattr(cli, "resolve_plugins_allowlist", lambda _settings: None)
+
+    runner = CliRunner()
+    result = runner.invoke(cli.create_app(), ["init", "CODEX"])
+
+    assert result.exit_code == 1
+    assert isinstance(result.exception, ConfigError)
+    assert "must not match engine ids" in str(result.exception)
+    assert not config_path.exists()
+
+
 def test_plugins_cmd_loads_and_reports_errors(monkeypatch) -> None:
     entrypoints = {
         ENGINE_GROUP: [
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from pathlib import Path
+
 import pytest
 
 from yee88 import cli
@@ -96,6 +98,15 @@ def test_resolve_transport_id_override(monkeypatch) -> None:
     assert cli._resolve_transport_id(None) == "telegram"
 
 
+def test_cli_hook_keeps_falsy_overrides(monkeypatch) -> None:
+    from yee88.cli.run import _cli_hook
+
+    monkeypatch.setattr(cli, "_fail_missing_config", None)
+    assert _cli_hook("_fail_missing_config", "default") == "default"
+    monkeypatch.setattr(cli, "_fail_missing_config", 0)
+    assert _cli_hook("_fail_missing_config", "default") == 0
+
+
 def test_doctor_file_checks() -> None:
     settings = _settings()
     checks = cli._doctor_file_checks(settings)
@@ -192,3 +203,10 @@ def test_acquire_config_lock_reports_error(monkeypatch, tmp_path) -> None:
 
     assert exc.value.exit_code == 1
     assert any("already running" in msg for msg, _ in messages)
+
+
+def test_default_alias_from_path_strips_git_suffix() -> None:
+    assert cli._default_alias_from_path(Path("/src/z80.git")) == "z80"
+    assert cli._default_alias_from_path("/src/z80/") == "z80"
+    assert cli._default_alias_from_path(Path("/src/.git")) is None
+    assert cli._default_alias_from_path(Path("/")) is None
@@ -0,0 +1,43 @@
+import json
+import signal
+
+from yee88.cli import reload
+from yee88.lockfile import lock_path_for_config
+
+
+def _write_lock(config_path, pid: int) -> None:
+    lock_path = lock_path_for_config(config_path)
+    lock_path.write_text(
+        json.dumps({"pid": pid, "token_fingerprint": "deadbeef"}),
+        encoding="utf-8",
+    )
+
+
+def test_send_reload_signal_signals_lock_owner(tmp_path, monkeypatch) -> None:
+    config_path = tmp_path / "yee88.toml"
+    _write_lock(config_path, 424242)
+    sent: list[tuple[int, int]] = []
+    monkeypatch.setattr(reload.os, "kill", lambda pid, sig: sent.append((pid, sig)))
+
+    assert reload.send_reload_signal(config_path) is True
+    assert sent == [(424242, signal.SIGHUP)]
+
+
+def test_send_reload_signal_drops_stale_lock(tmp_path, monkeypatch) -> None:
+    config_path = tmp_path / "yee88.toml"
+    _write_lock(config_path, 424242)
+
+    def _kill(pid: int, sig: int) -> None:
+        raise ProcessLookupError(pid)
+
+    monkeypatch.setattr(reload.os, "kill", _kill)
+
+    assert reload.send_reload_signal(config_path) is False
+    assert not lock_path_for_config(config_path).exists()
+
+
+def test_find_running_instance_ignores_non_positive_pid(tmp_path) -> None:
+    config_path = tmp_path / "yee88.toml"
+    _write_lock(config_path, 0)
+
+    assert reload._find_running_instance(config_path) is None
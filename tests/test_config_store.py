@@ -38,3 +38,32 @@ def test_read_config_non_file(tmp_path: Path) -> None:
     config_path.mkdir()
     with pytest.raises(ConfigError, match="exists but is not a file"):
         read_config(config_path)
+
+
+def test_read_config_reuses_parse_until_file_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import yee88.config as config_mod
+
+    config_path = tmp_path / "yee88.toml"
+    write_config({"default_engine": "codex"}, config_path)
+
+    calls: list[str] = []
+    real_loads = config_mod.tomllib.loads
+
+    def _loads(raw: str) -> dict:
+        calls.append(raw)
+        return real_loads(raw)
+
+    monkeypatch.setattr(config_mod.tomllib, "loads", _loads)
+
+    first = read_config(config_path)
+    first["default_engine"] = "mutated"
+    second = read_config(config_path)
+
+    assert second == {"default_engine": "codex"}
+    assert len(calls) == 1
+
+    write_config({"default_engine": "claude"}, config_path)
+    assert read_config(config_path) == {"default_engine": "claude"}
+    assert len(calls) == 2
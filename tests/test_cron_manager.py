@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import tomllib
 from datetime import datetime, timedelta
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 from zoneinfo import ZoneInfo
 
 import pytest
+from croniter import croniter
 
 from yee88.cron.manager import CronManager
 from yee88.cron.models import CronJob
@@ -120,6 +122,16 @@ class TestCronManagerCRUD:
         assert len(jobs) == 1
         assert jobs[0].id == "test-job"
 
+    def test_listed_jobs_are_a_copy(self, cron_manager: CronManager, sample_job: CronJob) -> None:
+        """Test that editing a returned list leaves the manager's jobs alone."""
+        cron_manager.add(sample_job)
+
+        cron_manager.list().clear()
+        cron_manager.jobs.clear()
+
+        assert cron_manager.get("test-job") is sample_job
+        assert cron_manager.jobs == [sample_job]
+
     def test_get_job(self, cron_manager: CronManager, sample_job: CronJob) -> None:
         """Test getting a specific job."""
         cron_manager.add(sample_job)
@@ -146,6 +158,146 @@ class TestCronManagerCRUD:
         assert len(manager2.jobs) == 1
         assert manager2.jobs[0].id == "test-job"
 
+    def test_save_round_trips_all_fields(self, tmp_config_dir: Path) -> None:
+        """Test that every job field survives a save/load cycle."""
+        jobs = [
+            CronJob(
+                id="quoted",
+                schedule="0 9 * * *",
+                message='line one\nsay "hi" \\ done',
+                project="",
+                enabled=False,
+                last_run="2024-01-15T09:00:00+08:00",
+                engine="codex",
+                model="o3",
+            ),
+            CronJob(id="plain", schedule="*/5 * * * *", message="ping", project=""),
+        ]
+        manager1 = CronManager(tmp_config_dir)
+        with manager1:
+            for job in jobs:
+                manager1.add(job)
+
+        manager2 = CronManager(tmp_config_dir)
+        manager2.load()
+
+        assert manager2.jobs == [
+            jobs[0],
+            CronJob(
+                id="plain",
+                schedule="*/5 * * * *",
+                message="ping",
+                project="",
+                engine="",
+                model="",
+            ),
+        ]
+
+    def test_load_ignores_unknown_job_keys(self, tmp_config_dir: Path) -> None:
+        """Test that extra keys in cron.toml do not break loading."""
+        (tmp_config_dir / "cron.toml").write_text(
+            '[[jobs]]\nid = "legacy"\nschedule = "0 9 * * *"\n'
+            'message = "hi"\nproject = ""\nlegacy_field = 1\n',
+            encoding="utf-8",
+        )
+        manager = CronManager(tmp_config_dir)
+        manager.load()
+
+        assert manager.jobs == [
+            CronJob(id="legacy", schedule="0 9 * * *", message="hi", project="")
+        ]
+
+    def test_load_coerces_hand_edited_values(self, tmp_config_dir: Path) -> None:
+        """Test that bare TOML datetimes and int ids load as strings."""
+        (tmp_config_dir / "cron.toml").write_text(
+            '[[jobs]]\nid = 7\nschedule = "0 9 * * *"\nmessage = "hi"\n'
+            'project = ""\nlast_run = 2026-01-02T09:00:00+08:00\n'
+            "[[jobs]]\nid = \"broken\"\n",
+            encoding="utf-8",
+        )
+        manager = CronManager(tmp_config_dir)
+        manager.load()
+
+        assert manager.jobs == [
+            CronJob(
+                id="7",
+                schedule="0 9 * * *",
+                message="hi",
+                project="",
+                last_run="2026-01-02T09:00:00+08:00",
+            )
+        ]
+        assert manager.get("7") is manager.jobs[0]
+
+    def test_load_skips_parse_when_file_unchanged(
+        self, tmp_config_dir: Path, sample_job: CronJob
+    ) -> None:
+        """Test that load() only re-parses cron.toml after it changes."""
+        writer = CronManager(tmp_config_dir)
+        writer.add(sample_job)
+
+        manager = CronManager(tmp_config_dir)
+        with patch("yee88.cron.manager.tomllib.loads", wraps=tomllib.loads) as decode:
+            manager.load()
+            manager.load()
+            assert decode.call_count == 1
+
+            writer.disable("test-job")
+            manager.load()
+            assert decode.call_count == 2
+
+        assert manager.jobs[0].enabled is False
+
+    def test_enable_already_enabled_job_skips_write(
+        self, cron_manager: CronManager, sample_job: CronJob
+    ) -> None:
+        """Test that a no-op enable does not rewrite cron.toml."""
+        cron_manager.add(sample_job)
+
+        with patch.object(cron_manager, "save") as save:
+            assert cron_manager.enable("test-job") is True
+
+        save.assert_not_called()
+
+    def test_reload_jobs_reports_changed_ids(
+        self, tmp_config_dir: Path, sample_job: CronJob
+    ) -> None:
+        """Test that reload_jobs reports edited, added and removed jobs."""
+        writer = CronManager(tmp_config_dir)
+        writer.add(sample_job)
+        manager = CronManager(tmp_config_dir)
+        manager.load()
+
+        assert manager.reload_jobs() == []
+
+        writer.disable("test-job")
+        assert manager.reload_jobs() == ["test-job"]
+
+        with writer:
+            writer.remove("test-job")
+            writer.add(
+                CronJob(id="other", schedule="0 8 * * *", message="m", project="")
+            )
+        assert sorted(manager.reload_jobs()) == ["other", "test-job"]
+
+    def test_batched_mutations_write_once(
+        self, cron_manager: CronManager, sample_job: CronJob
+    ) -> None:
+        """Test that mutations inside a batch are flushed in a single save."""
+        with (
+            patch.object(cron_manager, "save", wraps=cron_manager.save) as save,
+            cron_manager,
+        ):
+            cron_manager.add(sample_job)
+            cron_manager.disable("test-job")
+            cron_manager.enable("test-job")
+            assert save.call_count == 0
+
+        assert save.call_count == 1
+        manager2 = CronManager(cron_manager.file.parent)
+        manager2.load()
+        assert manager2.jobs[0].enabled is True
+
 
 # ============================================================================
 # Timezone Tests (should FAIL initially - proving the bug exists)
@@ -364,8 +516,7 @@ class TestGetDueJobs:
             enabled=True,
             one_time=True,
         )
-        manager.jobs.append(job)
-        manager.save()
+        manager.add(job)
         
         due_jobs = manager.get_due_jobs()
         
@@ -388,8 +539,7 @@ class TestGetDueJobs:
             enabled=True,
             last_run="",
         )
-        manager.jobs.append(job)
-        manager.save()
+        manager.add(job)
         
         due_jobs = manager.get_due_jobs()
         
@@ -414,9 +564,100 @@ class TestGetDueJobs:
             enabled=True,
             last_run=two_hours_ago.isoformat(),
         )
-        manager.jobs.append(job)
-        manager.save()
+        manager.add(job)
         
         due_jobs = manager.get_due_jobs()
         
-        assert any(j.id == "recurring-test" for j in due_jobs)
\ No newline at end of file
+        assert any(j.id == "recurring-test" for j in due_jobs)
+
+    def test_next_fire_is_reused_until_last_run_changes(self, tmp_config_dir: Path) -> None:
+        """Test that the next fire time is not recomputed on every poll."""
+        manager = CronManager(tmp_config_dir, timezone="Asia/Shanghai")
+
+        now = datetime.now(ZoneInfo("Asia/Shanghai"))
+        job = CronJob(
+            id="daily-test",
+            schedule="0 9 * * *",
+            message="Daily",
+            project="",
+            enabled=True,
+            last_run=now.isoformat(),
+        )
+        manager.add(job)
+
+        with patch("yee88.cron.manager.croniter", wraps=croniter) as spy:
+            assert manager.get_due_jobs() == []
+            assert manager.get_due_jobs() == []
+
+        assert spy.call_count == 1
+
+    def test_firing_seeds_next_fire_cache(self, tmp_config_dir: Path) -> None:
+        """Test that the tick after a fire reuses the run's next fire time."""
+        manager = CronManager(tmp_config_dir, timezone="Asia/Shanghai")
+
+        now = datetime.now(ZoneInfo("Asia/Shanghai"))
+        job = CronJob(
+            id="hourly-test",
+            schedule="0 * * * *",
+            message="Hourly",
+            project="",
+            enabled=True,
+            last_run=(now - timedelta(hours=2)).isoformat(),
+        )
+        manager.add(job)
+
+        assert manager.get_due_jobs() == [job]
+        with patch("yee88.cron.manager.croniter", wraps=croniter) as spy:
+            assert manager.get_due_jobs() == []
+
+        assert spy.call_count == 0
+
+    def test_croniter_is_reused_across_polls(self, tmp_config_dir: Path) -> None:
+        """Test that a job's cron expression is parsed once, not every poll."""
+        manager = CronManager(tmp_config_dir, timezone="Asia/Shanghai")
+
+        now = datetime.now(ZoneInfo("Asia/Shanghai"))
+        # Fires weekly at a time more than a day away, so it is never due.
+        weekday = (now + timedelta(days=3)).isoweekday() % 7
+        job = CronJob(
+            id="weekly-test",
+            schedule=f"0 9 * * {weekday}",
+            message="Weekly",
+            project="",
+            enabled=True,
+        )
+        manager.add(job)
+
+        with patch("yee88.cron.manager.croniter", wraps=croniter) as spy:
+            assert manager.get_due_jobs() == []
+            assert manager.get_due_jobs() == []
+            manager.next_fire_time(job, now)
+
+        assert spy.call_count == 1
+
+    def test_fired_job_next_fire_survives_reload(self, tmp_config_dir: Path) -> None:
+        """Test that a fired job's next fire time round-trips through cron.toml."""
+        manager = CronManager(tmp_config_dir, timezone="Asia/Shanghai")
+
+        now = datetime.now(ZoneInfo("Asia/Shanghai"))
+        job = CronJob(
+            id="hourly-test",
+            schedule="0 * * * *",
+            message="Hourly",
+            project="",
+            enabled=True,
+            last_run=(now - timedelta(hours=2)).isoformat(),
+        )
+        manager.add(job)
+        assert manager.get_due_jobs() == [job]
+
+        reloaded = CronManager(tmp_config_dir, timezone="Asia/Shanghai")
+        reloaded.load()
+        stored = reloaded.get("hourly-test")
+
+        assert stored is not None
+        assert stored.last_run == job.last_run
+        assert stored.next_run == job.next_run
+        assert reloaded.next_fire_time(stored, now) == manager.next_fire_time(job, now)
+        assert reloaded.next_fire_time(stored, now) > now
+        assert reloaded.get_due_jobs() == []
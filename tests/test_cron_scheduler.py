@@ -7,6 +7,7 @@ from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock
 from zoneinfo import ZoneInfo
 
+import anyio
 import pytest
 
 from yee88.cron.scheduler import CronScheduler
@@ -109,6 +110,43 @@ class TestCronSchedulerJobExecution:
         
         await scheduler._run_job_safe(job)
 
+    @pytest.mark.anyio
+    async def test_stop_interrupts_sleep(
+        self,
+        cron_manager: CronManager,
+        mock_callback: AsyncMock,
+        mock_task_group: MagicMock,
+    ) -> None:
+        scheduler = CronScheduler(cron_manager, mock_callback, mock_task_group)
+
+        with anyio.fail_after(5):
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(scheduler.start)
+                # No jobs, so the scheduler is sleeping for the full 60s.
+                await anyio.wait_all_tasks_blocked()
+                scheduler.stop()
+
+        assert scheduler.running is False
+
+    @pytest.mark.anyio
+    async def test_start_survives_unreadable_cron_file(
+        self,
+        cron_manager: CronManager,
+        mock_callback: AsyncMock,
+        mock_task_group: MagicMock,
+    ) -> None:
+        cron_manager.file.write_text("[[jobs]\n", encoding="utf-8")
+        scheduler = CronScheduler(cron_manager, mock_callback, mock_task_group)
+
+        with anyio.fail_after(5):
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(scheduler.start)
+                await anyio.wait_all_tasks_blocked()
+                assert scheduler.running is True
+                scheduler.stop()
+
+        assert cron_manager.jobs == []
+
 
 class TestCronSchedulerTimezone:
 
@@ -134,10 +172,51 @@ class TestCronSchedulerTimezone:
             enabled=True,
             one_time=True,
         )
-        manager.jobs.append(job)
-        manager.save()
+        manager.add(job)
         
         due_jobs = manager.get_due_jobs()
         
         assert len(due_jobs) == 1
-        assert due_jobs[0].id == "past-job"
\ No newline at end of file
+        assert due_jobs[0].id == "past-job"
+
+
+class TestCronSchedulerNextCheck:
+
+    def test_sleeps_until_earliest_job(
+        self,
+        cron_manager: CronManager,
+        mock_callback: AsyncMock,
+        mock_task_group: MagicMock,
+    ) -> None:
+        now = datetime.now(ZoneInfo("Asia/Shanghai"))
+        cron_manager.add(
+            CronJob(
+                id="soon",
+                schedule=(now + timedelta(seconds=10)).isoformat(),
+                message="Soon",
+                project="",
+                one_time=True,
+            )
+        )
+        cron_manager.add(
+            CronJob(
+                id="daily",
+                schedule="0 9 * * *",
+                message="Daily",
+                project="",
+                last_run=now.isoformat(),
+            )
+        )
+        scheduler = CronScheduler(cron_manager, mock_callback, mock_task_group)
+
+        assert 8.0 < scheduler._calculate_next_check() <= 10.0
+
+    def test_sleeps_max_without_jobs(
+        self,
+        cron_manager: CronManager,
+        mock_callback: AsyncMock,
+        mock_task_group: MagicMock,
+    ) -> None:
+        scheduler = CronScheduler(cron_manager, mock_callback, mock_task_group)
+
+        assert scheduler._calculate_next_check() == 60.0
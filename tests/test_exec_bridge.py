@@ -1,9 +1,11 @@
+import threading
 import uuid
 
 import anyio
 import pytest
 
 from yee88.runner_bridge import (
+    THREADED_RENDER_MIN_CHARS,
     ExecBridgeConfig,
     HandleResult,
     IncomingMessage,
@@ -255,6 +257,37 @@ async def test_long_final_message_edits_progress_message() -> None:
     assert "✅" in final_text or "done" in final_text.lower()
 
 
+@pytest.mark.anyio
+async def test_long_final_answer_renders_off_event_loop_thread() -> None:
+    render_threads: list[int] = []
+
+    class _ThreadRecordingPresenter(MarkdownPresenter):
+        def render_final(self, state, *, elapsed_s, status, answer):
+            render_threads.append(threading.get_ident())
+            return super().render_final(
+                state, elapsed_s=elapsed_s, status=status, answer=answer
+            )
+
+    transport = FakeTransport()
+    cfg = ExecBridgeConfig(
+        transport=transport,
+        presenter=_ThreadRecordingPresenter(),
+        final_notify=False,
+    )
+
+    for answer in ("short", "x" * THREADED_RENDER_MIN_CHARS):
+        await handle_message(
+            cfg,
+            runner=_return_runner(answer=answer),
+            incoming=IncomingMessage(channel_id=123, message_id=10, text="hi"),
+            resume_token=None,
+        )
+
+    loop_thread = threading.get_ident()
+    assert render_threads[0] == loop_thread
+    assert render_threads[1] != loop_thread
+
+
 @pytest.mark.anyio
 async def test_progress_edits_are_best_effort() -> None:
     transport = FakeTransport()
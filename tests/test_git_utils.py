@@ -15,9 +15,8 @@ def test_resolve_main_worktree_root_prefers_common_dir_parent(monkeypatch) -> No
 
     def _fake_stdout(args, **kwargs):
         if args[:2] == ["rev-parse", "--path-format=absolute"]:
-            return str(base / ".git")
-        if args == ["rev-parse", "--is-bare-repository"]:
-            return "false"
+            assert "--is-bare-repository" in args
+            return f"{base / '.git'}\nfalse"
         return None
 
     monkeypatch.setattr("yee88.utils.git.git_stdout", _fake_stdout)
@@ -29,9 +28,8 @@ def test_resolve_main_worktree_root_returns_cwd_for_bare_repo(monkeypatch) -> No
 
     def _fake_stdout(args, **kwargs):
         if args[:2] == ["rev-parse", "--path-format=absolute"]:
-            return str(cwd / "repo.git")
-        if args == ["rev-parse", "--is-bare-repository"]:
-            return "true"
+            assert "--is-bare-repository" in args
+            return f"{cwd / 'repo.git'}\ntrue"
         return None
 
     monkeypatch.setattr("yee88.utils.git.git_stdout", _fake_stdout)
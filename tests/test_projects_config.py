@@ -35,6 +35,19 @@ def test_parse_projects_default_project_must_exist() -> None:
         )
 
 
+def test_projects_config_alias_conflict() -> None:
+    settings = TakopiSettings.model_validate(_base_config())
+    projects = settings.to_projects_config(
+        config_path=Path("yee88.toml"),
+        engine_ids=["Codex"],
+        reserved=RESERVED_CHAT_COMMANDS,
+    )
+
+    assert projects.alias_conflict("CODEX") == "engine ids"
+    assert projects.alias_conflict("Cancel") == "reserved commands"
+    assert projects.alias_conflict("z80") is None
+
+
 def test_init_writes_project(monkeypatch, tmp_path) -> None:
     config_path = tmp_path / "yee88.toml"
     config_path.write_text(
@@ -1,3 +1,6 @@
+import threading
+
+from yee88.telegram import render
 from yee88.telegram.render import render_markdown, split_markdown_body
 
 
@@ -20,6 +23,16 @@ def test_render_markdown_code_fence_language_is_string() -> None:
     assert any(e.get("type") == "code" for e in entities)
 
 
+def test_render_markdown_uses_a_renderer_per_thread() -> None:
+    seen = []
+    worker = threading.Thread(target=lambda: seen.append(render._md_renderer()))
+    worker.start()
+    worker.join()
+
+    assert seen[0] is not render._md_renderer()
+    assert render._md_renderer() is render._md_renderer()
+
+
 def test_split_markdown_body_closes_and_reopens_fence() -> None:
     body = "```py\n" + ("line\n" * 10) + "```\n\npost"
 
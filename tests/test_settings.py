@@ -235,3 +235,32 @@ def test_load_settings_rejects_non_file(tmp_path: Path) -> None:
     config_path.mkdir()
     with pytest.raises(ConfigError, match="exists but is not a file"):
         load_settings(config_path)
+
+
+def test_migrate_config_file_skips_unchanged_file(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import yee88.config_migrations as migrations_mod
+
+    config_path = tmp_path / "yee88.toml"
+    config_path.write_text('bot_token = "token"\nchat_id = 123\n', encoding="utf-8")
+
+    assert migrations_mod.migrate_config_file(config_path) == ["legacy-telegram"]
+
+    calls: list[Path] = []
+    real_read = migrations_mod.read_config
+
+    def _read(path: Path) -> dict:
+        calls.append(path)
+        return real_read(path)
+
+    monkeypatch.setattr(migrations_mod, "read_config", _read)
+
+    assert migrations_mod.migrate_config_file(config_path) == []
+    assert calls == []
+
+    config_path.write_text(
+        'transport = "telegram"\nbot_token = "other"\n', encoding="utf-8"
+    )
+    assert migrations_mod.migrate_config_file(config_path) == ["legacy-telegram"]
+    assert calls == [config_path]
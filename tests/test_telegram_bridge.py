@@ -15,6 +15,7 @@ from yee88.telegram.commands.file_transfer import _handle_file_get, _handle_file
 from yee88.telegram.commands.model import _handle_model_command
 from yee88.telegram.commands.reasoning import _handle_reasoning_command
 from yee88.telegram.commands.topics import _handle_topic_command
+import yee88.telegram.bridge as bridge_module
 import yee88.telegram.loop as telegram_loop
 import yee88.telegram.topics as telegram_topics
 from yee88.directives import parse_directives
@@ -40,7 +41,7 @@ from yee88.telegram.engine_overrides import EngineOverrides
 from yee88.context import RunContext
 from yee88.config import ProjectConfig, ProjectsConfig
 from yee88.runner_bridge import ExecBridgeConfig, RunningTask
-from yee88.markdown import MarkdownPresenter
+from yee88.markdown import MarkdownParts, MarkdownPresenter
 from yee88.model import Action, ActionEvent, CompletedEvent, ResumeToken, StartedEvent
 from yee88.progress import ProgressTracker
 from yee88.router import AutoRouter, RunnerEntry
@@ -261,6 +262,30 @@ def test_telegram_presenter_clears_button_on_cancelled() -> None:
     assert rendered.extra["reply_markup"]["inline_keyboard"] == []
 
 
+def test_telegram_presenter_reuses_unchanged_progress_render(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    presenter = TelegramPresenter()
+    state = ProgressTracker(engine="codex").snapshot()
+    calls: list[MarkdownParts] = []
+    original = bridge_module.prepare_telegram
+
+    def spy(parts: MarkdownParts) -> tuple[str, list[dict]]:
+        calls.append(parts)
+        return original(parts)
+
+    monkeypatch.setattr(bridge_module, "prepare_telegram", spy)
+
+    first = presenter.render_progress(state, elapsed_s=1.2)
+    second = presenter.render_progress(state, elapsed_s=1.8)
+    third = presenter.render_progress(state, elapsed_s=2.1)
+
+    assert len(calls) == 2
+    assert second == first
+    assert second.extra["entities"] is not first.extra["entities"]
+    assert third.text != first.text
+
+
 def test_telegram_presenter_final_clears_button() -> None:
     presenter = TelegramPresenter()
     state = ProgressTracker(engine="codex").snapshot()
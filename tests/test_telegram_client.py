@@ -230,3 +230,31 @@ async def test_telegram_download_file_429_defaults_retry_after_on_bad_body() ->
     assert payload == b"ok"
     assert sleeps == [5.0]
     assert len(calls) == 2
+
+
+@pytest.mark.anyio
+async def test_telegram_get_me_is_fetched_once() -> None:
+    calls: list[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(1)
+        return httpx.Response(
+            200,
+            json={"ok": True, "result": {"id": 42, "username": "bunny_bot"}},
+            request=request,
+        )
+
+    transport = httpx.MockTransport(handler)
+
+    client = httpx.AsyncClient(transport=transport)
+    try:
+        tg = TelegramClient("123:abcDEF_ghij", http_client=client)
+        first = await tg.get_me()
+        second = await tg.get_me()
+    finally:
+        await client.aclose()
+
+    assert first is not None
+    assert first.id == 42
+    assert second is first
+    assert len(calls) == 1
@@ -98,6 +98,26 @@ def test_parse_incoming_update_filters_non_matching_chat() -> None:
     assert parse_incoming_update(update, chat_id=999) is None
 
 
+def test_parse_incoming_update_filters_chat_before_building_media(
+    monkeypatch,
+) -> None:
+    def _fail(*args, **kwargs):
+        raise AssertionError("media payload built for filtered chat")
+
+    monkeypatch.setattr("yee88.telegram.parsing._document_from_media", _fail)
+    update = Update(
+        update_id=1,
+        message=Message(
+            message_id=10,
+            caption="hello",
+            chat=Chat(id=123, type="private"),
+            document=Document(file_id="doc-id"),
+        ),
+    )
+
+    assert parse_incoming_update(update, chat_ids={999}) is None
+
+
 def test_parse_incoming_update_filters_non_text_and_non_voice() -> None:
     update = Update(
         update_id=1,
@@ -2,6 +2,7 @@ import pytest
 
 from yee88.context import RunContext
 from yee88.model import ResumeToken
+from yee88.telegram.engine_overrides import EngineOverrides
 from yee88.telegram.topic_state import TopicStateStore
 
 
@@ -115,3 +116,24 @@ async def test_topic_state_system_prompt_not_set(tmp_path) -> None:
     store = TopicStateStore(path)
 
     assert await store.get_system_prompt(1, 99) is None
+
+
+@pytest.mark.anyio
+async def test_topic_state_run_overrides(tmp_path) -> None:
+    path = tmp_path / "telegram_topics_state.json"
+    store = TopicStateStore(path)
+
+    assert await store.get_run_overrides(1, 10, "codex") == (None, None)
+
+    await store.set_context(
+        1, 10, RunContext(project="proj"), system_prompt="be helpful"
+    )
+    await store.set_engine_override(
+        1, 10, "codex", EngineOverrides(model="o3", reasoning=None)
+    )
+
+    assert await store.get_run_overrides(1, 10, "codex") == (
+        EngineOverrides(model="o3", reasoning=None),
+        "be helpful",
+    )
+    assert await store.get_run_overrides(1, 10, "claude") == (None, "be helpful")
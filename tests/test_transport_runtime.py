@@ -101,6 +101,18 @@ def test_resolve_message_reply_ctx_overrides_ambient() -> None:
     assert resolved.context_source == "reply_ctx"
 
 
+def test_resolve_message_reply_ctx_last_line_wins() -> None:
+    runtime = _make_runtime()
+
+    resolved = runtime.resolve_message(
+        text="hello",
+        reply_text="done\n`ctx: proj @old`\nctx:\n  CTX: proj @new  ",
+    )
+
+    assert resolved.context == RunContext(project="proj", branch="new")
+    assert resolved.context_source == "reply_ctx"
+
+
 def test_resolve_system_prompt_global_only() -> None:
     codex = ScriptRunner([Return(answer="ok")], engine="codex")
     router = AutoRouter(